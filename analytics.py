@@ -0,0 +1,316 @@
+"""
+Columnar analytics over hand-history logs.
+Loads batches of rounds from a binary hand-history log into NumPy columns
+and folds them into running aggregates: outcome rates, EV by starting
+hand and dealer upcard, bust frequencies and the bankroll curve. The
+hands of a split round are counted under the pair they were split from. The
+aggregates remember how far into the log they have read and can be saved,
+so a later update only scans the rounds added since. Requires NumPy.
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from cards import CARD_VALUES
+from history import (HEADER, VERSION, FIXED_SIZES, NET_SCALES, CONTINUES_ROUND, SPLIT_HAND,
+                     check_header, scan_records)
+from simulate import OUTCOMES
+from engine import BLACKJACK, BLACKJACK_PUSH, WIN, DEALER_BUST, PUSH, PLAYER_BUST, SURRENDERED
+
+
+BATCH_SIZE = 1 << 20
+
+# Blackjack value of each card byte (Card.index); Aces count 11
+INDEX_VALUES = np.array(CARD_VALUES, dtype=np.int8)
+
+(BLACKJACK_CODE, BLACKJACK_PUSH_CODE, WIN_CODE, DEALER_BUST_CODE,
+ PUSH_CODE, LOSS_CODE, PLAYER_BUST_CODE, SURRENDERED_CODE) = range(len(OUTCOMES))
+
+# Starting hands are keyed soft * 22 + total and upcards by value (2-11),
+# the same layout as the basic strategy table.
+HAND_KEYS = 44
+UPCARDS = 12
+
+
+class HandColumns:
+    """A batch of hands as parallel NumPy arrays."""
+
+    __slots__ = ('outcome', 'bet', 'net', 'start_total', 'start_soft', 'upcard',
+                 'player_cards', 'dealer_cards', 'actions', 'flags')
+
+    def __init__(self, outcome, bet, net, start_total, start_soft, upcard,
+                 player_cards, dealer_cards, actions, flags):
+        self.outcome = outcome
+        self.bet = bet
+        self.net = net
+        self.start_total = start_total
+        self.start_soft = start_soft
+        self.upcard = upcard
+        self.player_cards = player_cards
+        self.dealer_cards = dealer_cards
+        self.actions = actions
+        self.flags = flags
+
+    def __len__(self):
+        return len(self.outcome)
+
+    @property
+    def payout_multiplier(self):
+        """Amount returned per unit bet, as paid in BlackjackGame._end_game."""
+        return (self.bet + self.net) / self.bet
+
+    @property
+    def hand_key(self):
+        return self.start_soft * 22 + self.start_total
+
+    @property
+    def round_starts(self):
+        """Whether each hand is the first of its round."""
+        return (self.flags & CONTINUES_ROUND) == 0
+
+
+def _gather(data, offsets, start, size, dtype):
+    """Read a fixed-size little-endian field at start bytes into every record."""
+    idx = offsets[:, None] + np.arange(start, start + size)
+    return data[idx].view(dtype).ravel()
+
+
+def load_columns(data, offsets, version=VERSION):
+    """Decode the records whose bodies start at offsets into HandColumns.
+
+    A split hand's starting hand is the pair it was split from: its
+    first card twice.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    fixed_size = FIXED_SIZES[version]
+    if version >= 3:
+        flags = data[offsets + 12].astype(np.int16)
+    else:
+        flags = np.zeros(len(offsets), dtype=np.int16)
+    player_cards = data[offsets + 9].astype(np.int16)
+    first = INDEX_VALUES[data[offsets + fixed_size]]
+    second = INDEX_VALUES[data[offsets + fixed_size + 1]]
+    second = np.where(flags & SPLIT_HAND, first, second)
+    total = first.astype(np.int16) + second
+    return HandColumns(
+        outcome=data[offsets].copy(),
+        bet=_gather(data, offsets, 1, 4, '<u4').astype(np.float64),
+        net=_gather(data, offsets, 5, 4, '<i4') / NET_SCALES[version],
+        start_total=np.where(total == 22, 12, total),  # a pair of Aces is soft 12
+        start_soft=((first == 11) | (second == 11)).astype(np.int16),
+        upcard=INDEX_VALUES[data[offsets + fixed_size + player_cards]].astype(np.int16),
+        player_cards=player_cards,
+        dealer_cards=data[offsets + 10].astype(np.int16),
+        actions=data[offsets + 11].astype(np.int16),
+        flags=flags,
+    )
+
+
+def iter_batches(path, batch_size=BATCH_SIZE, start=None):
+    """Yield (HandColumns, next offset) for the hands in a log from start."""
+    if os.path.getsize(path) < len(HEADER):
+        return
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    version = check_header(data, path)
+    pos = len(HEADER) if start is None else start
+    while True:
+        offsets, pos = scan_records(data, pos, batch_size)
+        if not offsets:
+            return
+        yield load_columns(data, offsets, version), pos
+
+
+class RunningAggregates:
+    """Statistics over every hand seen so far, updated batch by batch.
+
+    Outcome rates, the bankroll curve and the EV and bust tables are per
+    hand; rounds counts rounds, a split round once.
+    """
+
+    ARRAYS = ('outcome_counts', 'cell_rounds', 'cell_wagered', 'cell_net',
+              'cell_busts', 'upcard_played', 'upcard_busts', 'curve')
+    SCALARS = ('offset', 'rounds', 'hands', 'wagered', 'net', 'bankroll', 'peak',
+               'max_drawdown', 'curve_step')
+
+    def __init__(self, curve_step=1000):
+        self.offset = len(HEADER)  # where the next unread record starts
+        self.rounds = 0
+        self.hands = 0
+        self.wagered = 0.0
+        self.net = 0.0
+        self.bankroll = 0.0  # cumulative net
+        self.peak = 0.0
+        self.max_drawdown = 0.0
+        self.curve_step = curve_step
+        self.outcome_counts = np.zeros(len(OUTCOMES), dtype=np.int64)
+        cells = HAND_KEYS * UPCARDS
+        self.cell_rounds = np.zeros(cells, dtype=np.int64)
+        self.cell_wagered = np.zeros(cells)
+        self.cell_net = np.zeros(cells)
+        self.cell_busts = np.zeros(cells, dtype=np.int64)
+        self.upcard_played = np.zeros(UPCARDS, dtype=np.int64)
+        self.upcard_busts = np.zeros(UPCARDS, dtype=np.int64)
+        self.curve = np.zeros(0)
+
+    def update(self, columns):
+        """Fold one batch of hands into the aggregates."""
+        n = len(columns)
+        if not n:
+            return
+        outcome = columns.outcome
+        cells = HAND_KEYS * UPCARDS
+        cell = columns.hand_key * UPCARDS + columns.upcard
+
+        self.outcome_counts += np.bincount(outcome, minlength=len(OUTCOMES))
+        self.cell_rounds += np.bincount(cell, minlength=cells)
+        self.cell_wagered += np.bincount(cell, weights=columns.bet, minlength=cells)
+        self.cell_net += np.bincount(cell, weights=columns.net, minlength=cells)
+        self.cell_busts += np.bincount(cell[outcome == PLAYER_BUST_CODE], minlength=cells)
+
+        # The dealer plays out unless the hand busted, surrendered or was a natural
+        played = ((outcome != PLAYER_BUST_CODE) & (outcome != BLACKJACK_CODE)
+                  & (outcome != BLACKJACK_PUSH_CODE) & (outcome != SURRENDERED_CODE))
+        self.upcard_played += np.bincount(columns.upcard[played], minlength=UPCARDS)
+        self.upcard_busts += np.bincount(columns.upcard[outcome == DEALER_BUST_CODE],
+                                         minlength=UPCARDS)
+
+        cumulative = self.bankroll + np.cumsum(columns.net)
+        peaks = np.maximum(np.maximum.accumulate(cumulative), self.peak)
+        self.max_drawdown = max(self.max_drawdown, float((peaks - cumulative).max()))
+        first = self.curve_step - self.hands % self.curve_step - 1
+        self.curve = np.concatenate([self.curve, cumulative[first::self.curve_step]])
+        self.peak = float(peaks[-1])
+        self.bankroll = float(cumulative[-1])
+
+        self.rounds += int(columns.round_starts.sum())
+        self.hands += n
+        self.wagered += float(columns.bet.sum())
+        self.net += float(columns.net.sum())
+
+    def update_from_log(self, path, batch_size=BATCH_SIZE):
+        """Read the rounds appended to a log since the last update."""
+        before = self.rounds
+        for columns, pos in iter_batches(path, batch_size, self.offset):
+            self.update(columns)
+            self.offset = pos
+        return self.rounds - before
+
+    def _rate(self, *codes):
+        if not self.hands:
+            return 0.0
+        return sum(int(self.outcome_counts[OUTCOMES.index(code)]) for code in codes) / self.hands
+
+    @property
+    def win_rate(self):
+        return self._rate(BLACKJACK, WIN, DEALER_BUST)
+
+    @property
+    def push_rate(self):
+        return self._rate(BLACKJACK_PUSH, PUSH)
+
+    @property
+    def player_bust_rate(self):
+        return self._rate(PLAYER_BUST)
+
+    @property
+    def surrender_rate(self):
+        return self._rate(SURRENDERED)
+
+    @property
+    def dealer_bust_rate(self):
+        """Share of the rounds the dealer played out that ended in a dealer bust."""
+        played = self.upcard_played.sum()
+        return float(self.upcard_busts.sum() / played) if played else 0.0
+
+    @property
+    def expected_value(self):
+        """Net winnings per unit bet."""
+        return self.net / self.wagered if self.wagered else 0.0
+
+    def ev_table(self):
+        """(HAND_KEYS, UPCARDS) array of EV per unit bet; NaN where unseen."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ev = self.cell_net / self.cell_wagered
+        return ev.reshape(HAND_KEYS, UPCARDS)
+
+    def player_bust_table(self):
+        """(HAND_KEYS, UPCARDS) array of player bust frequency; NaN where unseen."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rate = self.cell_busts / self.cell_rounds
+        return rate.reshape(HAND_KEYS, UPCARDS)
+
+    def dealer_bust_by_upcard(self):
+        """Dealer bust frequency for each upcard value the dealer played out."""
+        return {value: float(self.upcard_busts[value] / self.upcard_played[value])
+                for value in range(2, UPCARDS) if self.upcard_played[value]}
+
+    def bankroll_curve(self):
+        """Cumulative net after every curve_step hands."""
+        return self.curve
+
+    def save(self, path):
+        """Save the aggregates (and the log offset) to an .npz file."""
+        values = {name: getattr(self, name) for name in self.ARRAYS}
+        values.update((name, np.float64(getattr(self, name))) for name in self.SCALARS)
+        with open(path, 'wb') as f:
+            np.savez(f, **values)
+
+    @classmethod
+    def load(cls, path):
+        """Load aggregates written by save."""
+        aggregates = cls()
+        with np.load(path) as data:
+            for name in cls.ARRAYS:
+                setattr(aggregates, name, data[name])
+            for name in cls.SCALARS:
+                # Files saved before hands was kept counted every hand as a round
+                setattr(aggregates, name, data[name if name in data else 'rounds'].item())
+        for name in ('offset', 'rounds', 'hands', 'curve_step'):
+            setattr(aggregates, name, int(getattr(aggregates, name)))
+        return aggregates
+
+
+def _hand_label(key):
+    soft, total = divmod(key, 22)
+    return f"{'S' if soft else 'H'}{total}"
+
+
+def main():
+    """Update aggregates from a hand-history log and print them."""
+    parser = argparse.ArgumentParser(description="Analyze a Blackjack hand-history log.")
+    parser.add_argument('log')
+    parser.add_argument('--state', default=None,
+                        help="aggregates file to resume from and save back to")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.state and os.path.exists(args.state):
+        aggregates = RunningAggregates.load(args.state)
+    else:
+        aggregates = RunningAggregates()
+    added = aggregates.update_from_log(args.log, args.batch_size)
+    if args.state:
+        aggregates.save(args.state)
+
+    print(f"Rounds: {aggregates.rounds} ({added} new), hands: {aggregates.hands}")
+    print(f"Win rate: {aggregates.win_rate:.4f}  Push rate: {aggregates.push_rate:.4f}")
+    print(f"Player busts: {aggregates.player_bust_rate:.4f}  "
+          f"Dealer busts: {aggregates.dealer_bust_rate:.4f}")
+    print(f"EV per unit bet: {aggregates.expected_value:+.4f}  "
+          f"Max drawdown: {aggregates.max_drawdown:g}")
+
+    print("\nEV % by starting hand (rows) and dealer upcard")
+    print('     ' + ''.join(f"{'A' if up == 11 else up:>6}" for up in range(2, UPCARDS)))
+    ev = aggregates.ev_table()
+    for key in range(HAND_KEYS):
+        row = ev[key, 2:]
+        if np.isnan(row).all():
+            continue
+        cells = ''.join('     .' if np.isnan(x) else f"{x * 100:6.0f}" for x in row)
+        print(f"{_hand_label(key):<5}{cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Bankroll and risk-of-ruin analysis.
+Given the distribution of a hand's net result per unit bet and a betting
+scheme (the GUI's $10, $25 and $50 buttons or All-In), computes the chance
+of going broke within N hands, the expected number of hands played and
+the distribution of the balance after N hands. The exact mode steps a
+probability vector over a discretized balance grid; the random-walk mode
+plays many bankrolls at once as NumPy arrays, in chunks so memory stays
+bounded however many paths are run. Requires NumPy.
+"""
+
+import argparse
+import math
+from fractions import Fraction
+
+import numpy as np
+
+from engine import (BLACKJACK, BLACKJACK_PUSH, WIN, DEALER_BUST, PUSH, LOSS,
+                    PLAYER_BUST, SURRENDERED)
+from rules import Rules, compile_rules
+
+
+# The GUI's starting balance, and the smallest bet validate_bet accepts:
+# below it a player cannot place another bet and is ruined
+STARTING_BALANCE = 1000
+MIN_BET = 1
+
+# Balances above CEILING_FACTOR times the starting bankroll are clipped
+CEILING_FACTOR = 10
+CHUNK_SIZE = 10000
+
+# Net result per unit bet of each outcome; a blackjack pays per the rules
+OUTCOME_NETS = {BLACKJACK_PUSH: 0, WIN: 1, DEALER_BUST: 1, PUSH: 0, LOSS: -1,
+                PLAYER_BUST: -1, SURRENDERED: -0.5}
+
+
+class OutcomeDistribution:
+    """Net results per unit bet of one hand and their probabilities."""
+
+    def __init__(self, nets, probabilities):
+        merged = {}
+        for net, probability in zip(nets, probabilities):
+            if not probability:
+                continue
+            merged[float(net)] = merged.get(float(net), 0.0) + probability
+        total = sum(merged.values())
+        if total <= 0:
+            raise ValueError("an outcome distribution needs positive probabilities")
+        self.nets = np.array(sorted(merged))
+        self.probabilities = np.array([merged[net] / total for net in sorted(merged)])
+
+    @property
+    def mean(self):
+        """Expected net per unit bet."""
+        return float(self.nets @ self.probabilities)
+
+    @property
+    def variance(self):
+        return float((self.nets ** 2) @ self.probabilities - self.mean ** 2)
+
+    def grid_gcd(self):
+        """Largest fraction of a unit every net result is a whole multiple of."""
+        fractions = [Fraction(net).limit_denominator(100) for net in self.nets if net]
+        numerator = 0
+        denominator = 1
+        for fraction in fractions:
+            numerator = math.gcd(numerator, fraction.numerator)
+            denominator = denominator * fraction.denominator // math.gcd(denominator,
+                                                                         fraction.denominator)
+        return numerator / denominator if numerator else 1.0
+
+    @classmethod
+    def from_counts(cls, counts, rules=None):
+        """From outcome counts such as SimulationStats.counts."""
+        blackjack_net = compile_rules(rules).blackjack_multiplier - 1
+        nets = [blackjack_net if outcome == BLACKJACK else OUTCOME_NETS[outcome]
+                for outcome in counts]
+        return cls(nets, list(counts.values()))
+
+    @classmethod
+    def from_history(cls, path):
+        """From the hands in a hand-history log, as actually paid (doubles included)."""
+        from analytics import iter_batches
+
+        nets = {}
+        for columns, _ in iter_batches(path):
+            values, counts = np.unique(np.round(columns.net / columns.bet, 4),
+                                       return_counts=True)
+            for value, count in zip(values.tolist(), counts.tolist()):
+                nets[value] = nets.get(value, 0) + count
+        return cls(list(nets), list(nets.values()))
+
+    @classmethod
+    def simulate(cls, rounds, policy=None, rules=None, seed=None, workers=None):
+        """Estimate the distribution by simulating rounds with simulate.simulate."""
+        from simulate import simulate
+        from strategy import basic_strategy
+
+        stats = simulate(rounds, workers=workers, seed=seed,
+                         policy=policy or basic_strategy, rules=rules)
+        return cls.from_counts(stats.counts, rules)
+
+    def __repr__(self):
+        pairs = ', '.join(f"{net:+g}: {p:.4f}" for net, p in zip(self.nets, self.probabilities))
+        return f"OutcomeDistribution({pairs})"
+
+
+class FlatBet:
+    """Bet a fixed amount each hand, or the whole balance once it is smaller."""
+
+    def __init__(self, amount):
+        self.amount = amount
+        self.label = f"${amount:g}"
+
+    def bets(self, balances):
+        return np.minimum(balances, self.amount)
+
+    def grid_unit(self, bankroll):
+        return self.amount
+
+
+class AllIn:
+    """Bet the whole balance every hand."""
+
+    label = "All-In"
+
+    def bets(self, balances):
+        return balances
+
+    def grid_unit(self, bankroll):
+        # Bets scale with the balance; a hundredth of the bankroll keeps the grid fine
+        return bankroll / 100
+
+
+# The GUI's bet buttons
+BET_SCHEMES = {'10': FlatBet(10), '25': FlatBet(25), '50': FlatBet(50), 'all-in': AllIn()}
+
+
+class BankrollResult:
+    """Ruin probabilities by hand and the balance distribution after the last hand."""
+
+    def __init__(self, hands, ruin_by_hand, balances, distribution):
+        self.hands = hands
+        self.ruin_by_hand = ruin_by_hand  # P(ruined by hand n), n = 0..hands
+        self.balances = balances  # grid balances
+        self.distribution = distribution  # P(balance after the last hand), by grid point
+
+    @property
+    def risk_of_ruin(self):
+        """Chance of going broke within the hands played."""
+        return float(self.ruin_by_hand[-1])
+
+    @property
+    def expected_hands(self):
+        """Expected hands played before going broke, up to the hand limit."""
+        return float((1 - self.ruin_by_hand[:-1]).sum())
+
+    @property
+    def expected_balance(self):
+        return float(self.balances @ self.distribution)
+
+    def quantile(self, q):
+        """Balance at the q-th quantile of the final distribution."""
+        index = np.searchsorted(np.cumsum(self.distribution), q * self.distribution.sum())
+        return float(self.balances[min(index, len(self.balances) - 1)])
+
+
+def _grid(distribution, scheme, bankroll, step, ceiling):
+    step = step or scheme.grid_unit(bankroll) * distribution.grid_gcd()
+    ceiling = ceiling or CEILING_FACTOR * bankroll
+    return np.arange(int(round(ceiling / step)) + 1) * step, step
+
+
+def exact(distribution, scheme, bankroll=STARTING_BALANCE, hands=1000, step=None,
+          ceiling=None):
+    """Risk of ruin by dynamic programming over a discretized balance grid.
+
+    Balances are multiples of step (by default the smallest change a flat
+    bet can make) up to ceiling; results landing between grid points are
+    rounded to the nearest one, and balances above the ceiling are clipped
+    to it. Balances below MIN_BET are ruin and absorbing.
+    """
+    balances, step = _grid(distribution, scheme, bankroll, step, ceiling)
+    top = len(balances) - 1
+    ruined = balances < MIN_BET
+    bets = scheme.bets(balances)
+    # Grid index each balance moves to for each outcome
+    moves = []
+    for net in distribution.nets:
+        target = np.clip(np.rint((balances + net * bets) / step), 0, top).astype(np.intp)
+        target[ruined | ruined[target]] = 0
+        moves.append(target)
+
+    p = np.zeros(len(balances))
+    p[min(int(round(bankroll / step)), top)] = 1.0
+    ruin_by_hand = np.empty(hands + 1)
+    ruin_by_hand[0] = p[ruined].sum()
+    for hand in range(1, hands + 1):
+        new = np.zeros_like(p)
+        for target, probability in zip(moves, distribution.probabilities):
+            new += np.bincount(target, weights=p * probability, minlength=len(p))
+        p = new
+        ruin_by_hand[hand] = p[0]
+    return BankrollResult(hands, ruin_by_hand, balances, p)
+
+
+def random_walk(distribution, scheme, bankroll=STARTING_BALANCE, hands=1000, paths=100000,
+                chunk_size=CHUNK_SIZE, seed=None, step=None, ceiling=None):
+    """Risk of ruin by playing paths bankrolls as vectorized random walks.
+
+    Paths are played chunk_size at a time and folded into ruin counts
+    and a histogram on the same grid as exact, so memory does not grow
+    with the number of paths. Balances are exact; only the final
+    histogram is rounded to the grid.
+    """
+    balances, step = _grid(distribution, scheme, bankroll, step, ceiling)
+    top = len(balances) - 1
+    rng = np.random.default_rng(seed)
+    cumulative = np.cumsum(distribution.probabilities)
+    cumulative[-1] = 1.0
+    nets = distribution.nets
+    ruined_at = np.zeros(hands + 1, dtype=np.int64)
+    histogram = np.zeros(len(balances))
+
+    for start in range(0, paths, chunk_size):
+        n = min(chunk_size, paths - start)
+        balance = np.full(n, float(bankroll))
+        for hand in range(1, hands + 1):
+            outcome = np.searchsorted(cumulative, rng.random(len(balance)), side='right')
+            balance += nets[outcome] * scheme.bets(balance)
+            broke = balance < MIN_BET
+            if broke.any():
+                ruined_at[hand] += np.count_nonzero(broke)
+                balance = balance[~broke]  # only live bankrolls keep playing
+                if not len(balance):
+                    break
+        index = np.clip(np.rint(balance / step), 0, top).astype(np.intp)
+        histogram += np.bincount(index, minlength=len(balances))
+        histogram[0] += n - len(balance)
+
+    return BankrollResult(hands, np.cumsum(ruined_at) / paths, balances, histogram / paths)
+
+
+def main():
+    """Print risk of ruin and final balances for the GUI's bet buttons."""
+    parser = argparse.ArgumentParser(description="Blackjack bankroll and risk-of-ruin analysis.")
+    parser.add_argument('--bankroll', type=float, default=STARTING_BALANCE)
+    parser.add_argument('--hands', type=int, default=1000)
+    parser.add_argument('--bet', choices=sorted(BET_SCHEMES), action='append', default=None,
+                        help="betting scheme to analyze, repeatable (default: every bet button)")
+    parser.add_argument('--mode', choices=['exact', 'walk'], default='exact')
+    parser.add_argument('--paths', type=int, default=100000,
+                        help="random walks to play in walk mode")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--history', default=None,
+                        help="take the outcome distribution from a hand-history log")
+    parser.add_argument('--rounds', type=int, default=200000,
+                        help="rounds to simulate for the outcome distribution (basic strategy)")
+    Rules.add_arguments(parser, hit_stand_only=True)
+    args = parser.parse_args()
+
+    rules = Rules.from_args(args)
+    if args.history:
+        distribution = OutcomeDistribution.from_history(args.history)
+    else:
+        distribution = OutcomeDistribution.simulate(args.rounds, rules=rules, seed=args.seed)
+    print(distribution)
+    print(f"EV per unit bet: {distribution.mean:+.4f}  SD: {math.sqrt(distribution.variance):.3f}")
+    print(f"\n{'Bet':<8}{'Ruin':>9}{'Hands':>10}{'Mean':>11}{'5%':>9}{'50%':>9}{'95%':>9}"
+          f"   after {args.hands} hands from ${args.bankroll:g}")
+    for name in args.bet or BET_SCHEMES:
+        scheme = BET_SCHEMES[name]
+        if args.mode == 'exact':
+            result = exact(distribution, scheme, args.bankroll, args.hands)
+        else:
+            result = random_walk(distribution, scheme, args.bankroll, args.hands,
+                                 args.paths, seed=args.seed)
+        print(f"{scheme.label:<8}{result.risk_of_ruin:>9.2%}{result.expected_hands:>10.1f}"
+              f"{result.expected_balance:>11.2f}{result.quantile(0.05):>9g}"
+              f"{result.quantile(0.5):>9g}{result.quantile(0.95):>9g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Vectorized batch simulation of Blackjack with NumPy.
+Holds a whole batch of shuffled shoes as one integer array of card values
+and plays rounds on every shoe at once until each reaches its cut card
+(a single deck is played through), using the same rules as
+RoundEngine: the player hits below a fixed total and the dealer follows
+the table rules (S17 or H17). Requires NumPy.
+"""
+
+import argparse
+import functools
+
+import numpy as np
+
+from cards import Deck, get_card
+from engine import (RoundEngine, HIT, STAND, BLACKJACK, BLACKJACK_PUSH, WIN,
+                    DEALER_BUST, PUSH, LOSS, PLAYER_BUST, SURRENDERED)
+from rules import Rules, compile_rules
+from simulate import SimulationStats, OUTCOMES
+
+
+# Card values in one deck, Aces as 1 (a hand counts one Ace as 11 when
+# that does not bust it, like Hand.get_value); a value fits in 4 bits
+DECK_VALUES = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10] * 4,
+                       dtype=np.int8)
+
+# A hand stops drawing by 21, and every card adds at least 1, so neither
+# side can take more than 22 cards in a round.
+MAX_CARDS_PER_ROUND = 44
+
+(BLACKJACK_CODE, BLACKJACK_PUSH_CODE, WIN_CODE, DEALER_BUST_CODE,
+ PUSH_CODE, LOSS_CODE, PLAYER_BUST_CODE, SURRENDERED_CODE) = range(len(OUTCOMES))
+
+# Hand states: the hard total plus ACE when the hand holds an Ace
+ACE = 32
+STATES = 2 * ACE
+
+# Outcome code for rounds after a shoe reached its cut card
+NO_ROUND = -1
+
+
+def _outcome_code(player_value, dealer_value, player_bj, dealer_bj):
+    """Outcome code of a finished round, as RoundEngine resolves it."""
+    if player_bj:
+        return BLACKJACK_PUSH_CODE if dealer_bj else BLACKJACK_CODE
+    if player_value > 21:
+        return PLAYER_BUST_CODE
+    if dealer_value > 21:
+        return DEALER_BUST_CODE
+    if player_value > dealer_value:
+        return WIN_CODE
+    return LOSS_CODE if player_value < dealer_value else PUSH_CODE
+
+
+# Outcome code by player value + 32 * (dealer value + 32 * (player
+# blackjack + 2 * dealer blackjack)), so a round resolves in one lookup
+_OUTCOME_TABLE = np.array([_outcome_code(index % 32, index // 32 % 32, index // 1024 % 2,
+                                         index // 2048) for index in range(4096)],
+                          dtype=np.int8)
+
+
+def payouts(rules=None):
+    """Payout multipliers indexed like OUTCOMES, as paid by RoundEngine."""
+    rules = compile_rules(rules)
+    return np.array([{BLACKJACK: rules.blackjack_multiplier, BLACKJACK_PUSH: 1,
+                      WIN: 2, DEALER_BUST: 2, PUSH: 1, LOSS: 0, PLAYER_BUST: 0,
+                      SURRENDERED: 0.5}[outcome]
+                     for outcome in OUTCOMES])
+
+
+PAYOUTS = payouts()
+
+
+def make_shoes(n_shoes, decks=1, rng=None, extra=0):
+    """Return an (n_shoes, 52 * decks + extra) array of independently shuffled shoes.
+
+    The extra cards are the start of a fresh shuffle, dealt to a round
+    that runs past the end of its shoe, as Deck and Shoe reshuffle when
+    they run out mid-round.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    # Sort each card under a random key: the value rides in the low 4 bits,
+    # so one in-place sort shuffles without a gather. Cards whose 28-bit
+    # keys tie (about one six-deck shoe in 5,000) keep value order.
+    keys = rng.integers(0, 1 << 32, (n_shoes, len(DECK_VALUES) * decks), dtype=np.uint32)
+    keys &= np.uint32(~0xF & 0xFFFFFFFF)
+    keys.reshape(n_shoes, decks, -1)[:] |= DECK_VALUES.astype(np.uint32)
+    keys.sort(axis=1)
+    shoes = (keys & np.uint32(0xF)).astype(np.int8)
+    if extra:
+        shoes = np.concatenate([shoes, make_shoes(n_shoes, decks, rng)[:, :extra]], axis=1)
+    return shoes
+
+
+def cut_card(decks=1, penetration=0.75):
+    """Cards dealt before a shoe is reshuffled, as in simulate.run_chunk.
+
+    A single deck is played through; a multi-deck shoe stops at its cut card.
+    """
+    cards = len(DECK_VALUES) * decks
+    return cards if decks == 1 else int(cards * penetration)
+
+
+@functools.lru_cache(maxsize=None)
+def _hand_tables(stand_on, dealer_hits):
+    """Lookup tables over hand states for a player standing on stand_on.
+
+    A hand's state is its hard total (Aces as 1, capped at 31) plus ACE if
+    it holds an Ace. Returns (next state by state and card, value, player
+    hits, dealer hits), each indexed by state; dealer_hits is
+    CompiledRules.dealer_hits.
+    """
+    next_state = np.zeros((STATES, 11), dtype=np.int8)
+    values = np.zeros(STATES, dtype=np.int16)
+    for state in range(STATES):
+        hard, ace = state % ACE, state >= ACE
+        for card in range(1, 11):
+            next_state[state, card] = min(hard + card, ACE - 1) + ACE * (ace or card == 1)
+        values[state] = hard + 10 if ace and hard <= 11 else hard
+    soft = np.array([state >= ACE and state % ACE <= 11 for state in range(STATES)])
+    dealer = np.array(dealer_hits)[values + 32 * soft]
+    return next_state, values, values < stand_on, dealer
+
+
+def play_batch_round(shoes, pos, stand_on=17, rules=None, rows=None):
+    """Play one round on the shoes in rows (every shoe by default).
+
+    Each round starts at its shoe's position and pos is advanced in place
+    past the cards used. Only hands still drawing are touched as the
+    round goes on. Returns outcome codes indexed like OUTCOMES, one per
+    row.
+    """
+    next_state, values, player_hits, dealer_hits = _hand_tables(
+        stand_on, compile_rules(rules).dealer_hits)
+    width = shoes.shape[1]
+    cards = shoes.reshape(-1)
+    if rows is None:
+        rows = np.arange(shoes.shape[0])
+    at = rows * width + pos[rows]  # flat index of each shoe's next card
+
+    player = next_state[next_state[0, cards[at]], cards[at + 2]]
+    dealer = next_state[next_state[0, cards[at + 1]], cards[at + 3]]
+    at += 4
+
+    def draw(hands, hitting, hits):
+        while hitting.size:
+            hands[hitting] = next_state[hands[hitting], cards[at[hitting]]]
+            at[hitting] += 1
+            hitting = hitting[hits[hands[hitting]]]
+
+    player_bj = values[player] == 21
+    dealer_bj = values[dealer] == 21
+
+    # Player's fixed strategy: hit below stand_on
+    draw(player, np.flatnonzero(~player_bj & player_hits[player]), player_hits)
+    player_value = values[player]
+    player_bust = player_value > 21
+
+    # Dealer hits per the table rules, as in RoundEngine.dealer_should_hit
+    draw(dealer, np.flatnonzero(~player_bj & ~player_bust & dealer_hits[dealer]), dealer_hits)
+
+    pos[rows] = at - rows * width
+    return _OUTCOME_TABLE[player_value + 32 * (values[dealer] + 32 * (player_bj + 2 * dealer_bj))]
+
+
+def play_shoes(shoes, stand_on=17, rules=None, cut=None):
+    """Play rounds on every shoe until it reaches its cut card.
+
+    Each shoe deals a new round while fewer than cut of its cards have
+    been used, so shoes finish independently; the default cut stops
+    where a whole round is no longer sure to fit. Returns an
+    (n_shoes, rounds) array of outcome codes, NO_ROUND after a shoe's
+    last round.
+    """
+    n, width = shoes.shape
+    limit = width - MAX_CARDS_PER_ROUND + 1
+    if cut is None:
+        cut = limit
+    elif cut > limit:
+        raise ValueError("a round started before the cut card could run out of cards")
+    pos = np.zeros(n, dtype=np.intp)
+    rounds = []
+    live = np.flatnonzero(pos < cut)
+    while live.size:
+        outcome = np.full(n, NO_ROUND, dtype=np.int8)
+        outcome[live] = play_batch_round(shoes, pos, stand_on, rules, live)
+        rounds.append(outcome)
+        live = live[pos[live] < cut]
+    if not rounds:
+        return np.empty((n, 0), dtype=np.int8)
+    return np.stack(rounds, axis=1)
+
+
+def outcome_stats(outcomes, rules=None):
+    """Convert an array of outcome codes into SimulationStats."""
+    counts = np.bincount(outcomes[outcomes != NO_ROUND], minlength=len(OUTCOMES))
+    net = float(np.dot(counts, (PAYOUTS if rules is None else payouts(rules)) - 1))
+    return SimulationStats(dict(zip(OUTCOMES, counts.tolist())), net)
+
+
+def _extra_cards(decks, cut):
+    """Cards past the end of the shoe a round started before the cut might need."""
+    return max(0, cut + MAX_CARDS_PER_ROUND - 1 - len(DECK_VALUES) * decks)
+
+
+def simulate_batch(n_shoes, batch_size=10000, decks=1, stand_on=17, seed=None,
+                   rules=None, penetration=0.75):
+    """Play every round in n_shoes shoes, batch_size shoes at a time."""
+    rng = np.random.default_rng(seed)
+    cut = cut_card(decks, penetration)
+    extra = _extra_cards(decks, cut)
+    stats = SimulationStats()
+    remaining = n_shoes
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        shoes = make_shoes(size, decks, rng, extra)
+        stats.merge(outcome_stats(play_shoes(shoes, stand_on, rules, cut), rules))
+        remaining -= size
+    return stats
+
+
+def _threshold_policy(stand_on):
+    """Scalar player policy matching the batch strategy."""
+    def policy(player_hand, dealer_upcard):
+        return HIT if player_hand.get_value() < stand_on else STAND
+    return policy
+
+
+def _scalar_deck(values):
+    """Build a Deck that draws the given card values in order."""
+    deck = Deck()
+    ranks = {1: 'A', 10: '10'}
+    deck.cards = [get_card(ranks.get(value, str(value)), '♠')
+                  for value in reversed(values.tolist())]
+    return deck
+
+
+def cross_check(n_shoes=1000, decks=1, stand_on=17, seed=None, rules=None,
+                penetration=0.75):
+    """Replay batch shoes through the scalar RoundEngine and compare outcomes.
+
+    Returns a list of (shoe, round) positions where the two paths disagree;
+    an empty list means the batch engine matches Hand/Deck exactly.
+    """
+    rng = np.random.default_rng(seed)
+    cut = cut_card(decks, penetration)
+    shoes = make_shoes(n_shoes, decks, rng, _extra_cards(decks, cut))
+    outcomes = play_shoes(shoes.copy(), stand_on, rules, cut)
+    policy = _threshold_policy(stand_on)
+
+    mismatches = []
+    for shoe_index in range(n_shoes):
+        engine = RoundEngine(deck=_scalar_deck(shoes[shoe_index]), rules=rules)
+        for round_index, code in enumerate(outcomes[shoe_index]):
+            if code == NO_ROUND:
+                break
+            result = engine.play_round(1, policy)
+            if result.outcome != OUTCOMES[code]:
+                mismatches.append((shoe_index, round_index))
+    return mismatches
+
+
+def main():
+    """Command-line entry point for batch simulation."""
+    parser = argparse.ArgumentParser(description="Vectorized Blackjack simulation.")
+    parser.add_argument('shoes', type=int, help="number of shoes to play out")
+    parser.add_argument('--decks', type=int, default=1)
+    parser.add_argument('--stand-on', type=int, default=17,
+                        help="player stands on this total or higher")
+    parser.add_argument('--penetration', type=float, default=0.75,
+                        help="fraction of a multi-deck shoe dealt before reshuffling "
+                             "(a single deck is played through)")
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--cross-check', action='store_true',
+                        help="verify the batch engine against the scalar engine")
+    Rules.add_arguments(parser, hit_stand_only=True)
+    args = parser.parse_args()
+    rules = Rules.from_args(args)
+
+    if args.cross_check:
+        mismatches = cross_check(args.shoes, args.decks, args.stand_on, args.seed, rules,
+                                 args.penetration)
+        print(f"Mismatched rounds: {len(mismatches)}")
+        return
+
+    stats = simulate_batch(args.shoes, args.batch_size, args.decks,
+                           args.stand_on, args.seed, rules, args.penetration)
+    print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Benchmarks for the Blackjack hot paths.
+Times card construction, deck building and shuffling, drawing, hand
+valuation, full headless rounds and, when a display is available, hand
+redraws on a Tk canvas. Results can be saved as JSON and compared against
+a saved baseline to flag regressions. --imports instead checks startup
+import times against budgets and that headless modules never load Tk.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+from cards import Card, Deck, Hand, Shoe, CARDS
+from engine import RoundEngine
+from strategy import basic_strategy
+
+
+# A benchmark is slower than the baseline by more than this fraction
+DEFAULT_THRESHOLD = 0.10
+REPEAT = 5
+
+# Cumulative import time budgets in seconds for modules on startup paths
+# (simulation workers, CLIs); none of them may import tkinter
+IMPORT_BUDGETS = {
+    'cards': 0.010,
+    'engine': 0.015,
+    'counting': 0.015,
+    'simulate': 0.030,
+    'blackjack': 0.010,
+}
+GUI_MODULES = ('tkinter', '_tkinter')
+
+
+def bench_card_construction(n):
+    for _ in range(n):
+        Card('Q', '♥')
+
+
+def bench_deck_create_shuffle(n):
+    deck = Deck(seed=1)
+    for _ in range(n):
+        deck.cards.clear()
+        deck._create_deck()
+        deck.shuffle_deck()
+
+
+def bench_deck_draw(n):
+    deck = Deck(seed=1)
+    draw = deck.draw_card
+    for _ in range(n):
+        draw()
+
+
+def bench_shoe_draw(n):
+    shoe = Shoe(6, seed=1)
+    draw = shoe.draw_card
+    for _ in range(n):
+        draw()
+        if shoe.needs_shuffle:
+            shoe.start_round()
+
+
+def _hand_of(size):
+    hand = Hand()
+    for i in range(size):
+        # Mix of Aces and low cards so larger hands stay meaningful
+        hand.add_card(CARDS[(i * 7) % 52])
+    return hand
+
+
+def _bench_hand_value(size):
+    def bench(n):
+        hand = _hand_of(size)
+        get_value = hand.get_value
+        for _ in range(n):
+            get_value()
+    return bench
+
+
+def _bench_hand_build(size):
+    cards = [CARDS[(i * 7) % 52] for i in range(size)]
+
+    def bench(n):
+        hand = Hand()
+        for _ in range(n):
+            hand.clear()
+            for card in cards:
+                hand.add_card(card)
+    return bench
+
+
+def bench_rounds_stand17(n):
+    engine = RoundEngine(deck=Deck(seed=1))
+    for _ in range(n):
+        engine.play_round()
+
+
+def bench_rounds_basic(n):
+    engine = RoundEngine(deck=Shoe(6, seed=1))
+    for _ in range(n):
+        engine.play_round(1, basic_strategy)
+
+
+BENCHMARKS = {
+    'card_construction': (bench_card_construction, 10000),
+    'deck_create_shuffle': (bench_deck_create_shuffle, 1000),
+    'deck_draw_card': (bench_deck_draw, 20000),
+    'shoe_draw_card': (bench_shoe_draw, 20000),
+    'hand_get_value_2': (_bench_hand_value(2), 50000),
+    'hand_get_value_5': (_bench_hand_value(5), 50000),
+    'hand_get_value_10': (_bench_hand_value(10), 50000),
+    'hand_build_2': (_bench_hand_build(2), 20000),
+    'hand_build_5': (_bench_hand_build(5), 10000),
+    'rounds_stand17': (bench_rounds_stand17, 5000),
+    'rounds_basic_strategy': (bench_rounds_basic, 5000),
+}
+
+
+def _gui_benchmarks():
+    """Canvas redraw benchmarks, or {} if no display is available."""
+    try:
+        from gui import BlackjackGame
+        game = BlackjackGame()
+    except Exception:
+        return {}
+    game.root.withdraw()
+    canvas = game.player_canvas
+
+    def draw_hand(size):
+        hand = _hand_of(size)
+
+        def bench(n):
+            for _ in range(n):
+                # Force a full redraw rather than the incremental no-op
+                game.renderer.forget(canvas)
+                game._draw_hand(canvas, hand)
+            game.root.update_idletasks()
+        return bench
+
+    return {
+        'tk_draw_hand_2': (draw_hand(2), 500),
+        'tk_draw_hand_5': (draw_hand(5), 200),
+    }
+
+
+def run(names=None, gui=True):
+    """Run benchmarks and return {name: seconds per operation}."""
+    benchmarks = dict(BENCHMARKS)
+    if gui:
+        benchmarks.update(_gui_benchmarks())
+
+    results = {}
+    for name, (func, n) in benchmarks.items():
+        if names and name not in names:
+            continue
+        best = min(timeit.repeat(lambda: func(n), number=1, repeat=REPEAT))
+        results[name] = best / n
+    return results
+
+
+def import_time(module):
+    """(cumulative seconds, names of modules loaded) importing module in a fresh interpreter."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                          capture_output=True, text=True, check=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)))
+    seconds = 0.0
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        name = name.strip()
+        loaded.add(name)
+        if name == module:
+            seconds = int(cumulative) / 1e6
+    return seconds, loaded
+
+
+def check_imports(budgets=IMPORT_BUDGETS):
+    """Return {module: (best seconds, budget, GUI modules loaded)} for every budgeted module."""
+    results = {}
+    for module, budget in budgets.items():
+        runs = [import_time(module) for _ in range(REPEAT)]
+        gui = sorted(set().union(*(loaded for _, loaded in runs)) & set(GUI_MODULES))
+        results[module] = (min(seconds for seconds, _ in runs), budget, gui)
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return (name, baseline, current, change) for regressed benchmarks."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous:
+            change = current / previous - 1
+            if change > threshold:
+                regressions.append((name, previous, current, change))
+    return regressions
+
+
+def _format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def main():
+    """Command-line entry point for the benchmark runner."""
+    parser = argparse.ArgumentParser(description="Benchmark Blackjack hot paths.")
+    parser.add_argument('names', nargs='*', help="benchmarks to run (default: all)")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="flag regressions against a saved JSON baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before flagging (default: 0.10)")
+    parser.add_argument('--no-gui', action='store_true',
+                        help="skip the Tk canvas benchmarks")
+    parser.add_argument('--imports', action='store_true',
+                        help="check module import times against their budgets instead")
+    args = parser.parse_args()
+
+    if args.imports:
+        failed = False
+        for module, (seconds, budget, gui) in check_imports().items():
+            over = seconds > budget
+            failed = failed or over or bool(gui)
+            note = f"  loads {', '.join(gui)}" if gui else ''
+            print(f"import {module:<14} {_format_time(seconds):>10} "
+                  f"(budget {_format_time(budget)}){' OVER' if over else ''}{note}")
+        sys.exit(1 if failed else 0)
+
+    results = run(args.names, gui=not args.no_gui)
+    for name, seconds in results.items():
+        print(f"{name:<24} {_format_time(seconds):>12}/op {1 / seconds:>14,.0f} ops/s")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'python': platform.python_version(),
+                       'machine': platform.machine(),
+                       'results': results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for name, previous, current, change in regressions:
+            print(f"REGRESSION {name}: {_format_time(previous)} -> "
+                  f"{_format_time(current)} ({change:+.1%})")
+        if regressions:
+            sys.exit(1)
+        print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Card, Deck and Hand model classes for Blackjack.
+"""
+
+import random
+
+
+SUITS = ['♠', '♥', '♦', '♣']
+RANKS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+RANK_VALUES = {'A': 11, 'J': 10, 'Q': 10, 'K': 10}  # Aces adjusted in Hand class
+RANK_VALUES.update((rank, int(rank)) for rank in RANKS[1:10])
+
+
+class Card:
+    """Represents a playing card with rank, suit, and value.
+    
+    Every card also has a compact index from 0 to 51 (suit-major, in the
+    order of SUITS and RANKS). Decks share the interned instances in CARDS
+    instead of creating new Card objects.
+    """
+    
+    __slots__ = ('rank', 'suit', 'value', 'index')
+    
+    def __init__(self, rank, suit):
+        self.rank = rank
+        self.suit = suit
+        self.value = self._calculate_value()
+        self.index = SUITS.index(suit) * 13 + RANKS.index(rank)
+    
+    def _calculate_value(self):
+        """Calculate the numeric value of the card."""
+        return RANK_VALUES[self.rank]
+    
+    @staticmethod
+    def from_index(index):
+        """Return the interned card for a compact index (0-51)."""
+        return CARDS[index]
+    
+    def __repr__(self):
+        return f"Card({self.rank!r}, {self.suit!r})"
+    
+    def __str__(self):
+        """String representation of the card."""
+        return f"{self.rank}{self.suit}"
+
+
+# The 52 interned cards, indexed by Card.index
+CARDS = tuple(Card(rank, suit) for suit in SUITS for rank in RANKS)
+
+# Card values indexed by Card.index
+CARD_VALUES = tuple(card.value for card in CARDS)
+
+
+def get_card(rank, suit):
+    """Return the interned card with the given rank and suit."""
+    return CARDS[SUITS.index(suit) * 13 + RANKS.index(rank)]
+
+
+def stream_seed(seed, *stream):
+    """Seed for an independent stream, e.g. stream_seed(seed, worker, shoe)."""
+    return ':'.join(str(part) for part in (seed,) + stream)
+
+
+def seeded_rng(seed, *stream):
+    """Return a random.Random for the given seed and stream counters."""
+    return random.Random(stream_seed(seed, *stream))
+
+
+class Deck:
+    """Manages a collection of playing cards."""
+    
+    def __init__(self, rng=None, seed=None):
+        # Any object with a shuffle() method, e.g. random.Random(seed).
+        # With a seed, the n-th shuffle uses its own stream seeded_rng(seed, n).
+        self.rng = rng if rng is not None else random
+        self.seed = seed
+        self.shuffles = 0
+        self.tracker = None  # optional counting.CountTracker told about each card
+        self.cards = []
+        self._create_deck()
+        self.shuffle_deck()
+    
+    def _create_deck(self):
+        """Create a standard 52-card deck from the interned cards."""
+        self.cards.extend(CARDS)
+    
+    def reset(self):
+        """Return all cards to the deck and shuffle it."""
+        self.cards.clear()
+        self._create_deck()
+        self.shuffle_deck()
+    
+    def shuffle_deck(self):
+        """Shuffle the deck of cards."""
+        if self.seed is not None:
+            self.rng = seeded_rng(self.seed, self.shuffles)
+        self.shuffles += 1
+        self.rng.shuffle(self.cards)
+        if self.tracker is not None:
+            self.tracker.reset()
+    
+    @property
+    def dealt(self):
+        """Number of cards drawn since the last shuffle."""
+        return len(CARDS) - len(self.cards)
+    
+    @property
+    def remaining(self):
+        """Number of cards left before the deck is rebuilt."""
+        return len(self.cards)
+    
+    def seek(self, shuffle, dealt):
+        """Restore a seeded deck to a point recorded by (shuffles - 1, dealt)."""
+        self.shuffles = shuffle
+        self.reset()
+        del self.cards[len(self.cards) - dealt:]
+    
+    def start_round(self):
+        """Prepare for a new round; a Deck only reshuffles when empty."""
+        return False
+    
+    def draw_card(self):
+        """Draw and return the top card from the deck."""
+        if not self.cards:
+            # If deck is empty, create and shuffle a new one
+            self._create_deck()
+            self.shuffle_deck()
+        card = self.cards.pop()
+        if self.tracker is not None:
+            self.tracker.see(card)
+        return card
+
+
+class Shoe:
+    """A multi-deck shoe with a cut card.
+    
+    Cards are dealt by advancing an index over a preallocated list, and the
+    shoe is reshuffled in place at the start of the first round after the
+    cut card has been reached.
+    """
+    
+    MIN_DECKS = 1
+    MAX_DECKS = 8
+    
+    def __init__(self, decks=6, penetration=0.75, rng=None, seed=None):
+        if not self.MIN_DECKS <= decks <= self.MAX_DECKS:
+            raise ValueError(f"decks must be between {self.MIN_DECKS} and {self.MAX_DECKS}")
+        if not 0 < penetration <= 1:
+            raise ValueError("penetration must be in (0, 1]")
+        
+        self.decks = decks
+        self.penetration = penetration
+        self.rng = rng if rng is not None else random
+        self.seed = seed
+        self.shuffles = 0
+        self.tracker = None  # optional counting.CountTracker told about each card
+        self._ordered = CARDS * decks
+        self.cards = list(self._ordered)
+        self.cut_card = int(len(self.cards) * penetration)
+        self.position = 0
+        self.shuffle_deck()
+    
+    @property
+    def remaining(self):
+        """Number of cards left to deal."""
+        return len(self.cards) - self.position
+    
+    @property
+    def needs_shuffle(self):
+        """Whether the cut card has been reached."""
+        return self.position >= self.cut_card
+    
+    def shuffle_deck(self):
+        """Shuffle every card back into the shoe (in-place Fisher-Yates)."""
+        if self.seed is not None:
+            self.rng = seeded_rng(self.seed, self.shuffles)
+        self.shuffles += 1
+        # Start from the unshuffled order so each shuffle depends only on its RNG
+        cards = self.cards
+        cards[:] = self._ordered
+        rand = self.rng.random
+        for i in range(len(cards) - 1, 0, -1):
+            j = int(rand() * (i + 1))
+            cards[i], cards[j] = cards[j], cards[i]
+        self.position = 0
+        if self.tracker is not None:
+            self.tracker.reset()
+    
+    @property
+    def dealt(self):
+        """Number of cards dealt since the last shuffle."""
+        return self.position
+    
+    def seek(self, shuffle, dealt):
+        """Restore a seeded shoe to a point recorded by (shuffles - 1, dealt)."""
+        self.shuffles = shuffle
+        self.shuffle_deck()
+        self.position = dealt
+    
+    def reset(self):
+        """Collect all cards and reshuffle the shoe."""
+        self.shuffle_deck()
+    
+    def start_round(self):
+        """Reshuffle at the round boundary if the cut card was reached.
+        
+        Returns True when the shoe was reshuffled.
+        """
+        if self.needs_shuffle:
+            self.shuffle_deck()
+            return True
+        return False
+    
+    def draw_card(self):
+        """Deal the next card from the shoe."""
+        if self.position >= len(self.cards):
+            # Only reachable with full penetration; reshuffle mid-round
+            self.shuffle_deck()
+        card = self.cards[self.position]
+        self.position += 1
+        if self.tracker is not None:
+            self.tracker.see(card)
+        return card
+
+
+class Hand:
+    """Holds cards and calculates scores.
+    
+    The hard total (Aces as 1), Ace count and resulting value are updated
+    as cards are added, so value, bust and blackjack checks are O(1).
+    """
+    
+    def __init__(self):
+        self.cards = []
+        self.hard_total = 0
+        self.aces = 0
+        self._value = 0
+        self._soft = False
+    
+    def add_card(self, card):
+        """Add a card to the hand."""
+        self.cards.append(card)
+        if card.value == 11:
+            self.aces += 1
+            self.hard_total += 1
+        else:
+            self.hard_total += card.value
+        
+        # At most one Ace can count as 11 without busting
+        if self.aces and self.hard_total <= 11:
+            self._value = self.hard_total + 10
+            self._soft = True
+        else:
+            self._value = self.hard_total
+            self._soft = False
+    
+    def get_value(self):
+        """Return the total value of the hand, handling Aces appropriately."""
+        return self._value
+    
+    @property
+    def is_soft(self):
+        """Whether an Ace is currently counted as 11."""
+        return self._soft
+    
+    def is_soft_17(self):
+        """Check if the hand is a soft 17 (e.g. Ace + 6)."""
+        return self._soft and self._value == 17
+    
+    def is_busted(self):
+        """Check if the hand value exceeds 21."""
+        return self._value > 21
+    
+    def is_blackjack(self):
+        """Check if the hand is a blackjack (21 with 2 cards)."""
+        return self._value == 21 and len(self.cards) == 2
+    
+    def clear(self):
+        """Remove all cards from the hand."""
+        self.cards.clear()
+        self.hard_total = 0
+        self.aces = 0
+        self._value = 0
+        self._soft = False
+    
+    def __str__(self):
+        """String representation of the hand."""
+        return ' '.join(str(card) for card in self.cards)
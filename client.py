@@ -0,0 +1,165 @@
+"""
+Clients for the Blackjack game server.
+`play` is a small interactive client for trying the server by hand; `load`
+opens many concurrent bot sessions that play basic strategy and reports
+request throughput and latency percentiles.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from engine import HIT
+from strategy import recommend_total
+
+
+class BlackjackClient:
+    """A connection to the game server speaking line-delimited JSON."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=8765, unix_path=None):
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, op, **fields):
+        """Send one request and return the decoded reply."""
+        fields['op'] = op
+        self.writer.write(json.dumps(fields).encode() + b'\n')
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        return json.loads(line)
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def _bot_session(rounds, bet, latencies, connect):
+    """Play rounds with basic strategy, recording each request's latency."""
+    client = await connect()
+    clock = time.perf_counter
+
+    async def timed(op, **fields):
+        start = clock()
+        reply = await client.request(op, **fields)
+        latencies.append(clock() - start)
+        return reply
+
+    try:
+        for _ in range(rounds):
+            reply = await timed('bet', amount=bet)
+            if not reply['ok']:
+                break  # out of money
+            state = reply['state']
+            while state['in_round']:
+                action = recommend_total(state['player_value'], state['player_soft'],
+                                         state['dealer_upcard_value'])
+                state = (await timed('hit' if action == HIT else 'stand'))['state']
+    finally:
+        await client.close()
+
+
+async def load_test(sessions, rounds, bet=10, host='127.0.0.1', port=8765,
+                    unix_path=None):
+    """Run concurrent bot sessions and return a summary dict."""
+    latencies = []
+
+    def connect():
+        return BlackjackClient.connect(host, port, unix_path)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_bot_session(rounds, bet, latencies, connect)
+                           for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'sessions': sessions,
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'requests_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000,
+        'max_ms': (latencies[-1] if latencies else 0.0) * 1000,
+    }
+
+
+async def interactive(host='127.0.0.1', port=8765, unix_path=None):
+    """Read commands (bet N, hit, stand, double, ..., state, quit) from stdin."""
+    client = await BlackjackClient.connect(host, port, unix_path)
+    print("Commands: bet <amount>, hit, stand, double, split, surrender, insurance, "
+          "state, quit")
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            words = line.split()
+            if not words or words[0] == 'quit':
+                break
+            fields = {'amount': words[1]} if words[0] == 'bet' and len(words) > 1 else {}
+            reply = await client.request(words[0], **fields)
+            if not reply['ok']:
+                print(f"Error: {reply['error']}")
+                continue
+            state = reply['state']
+            dealer_value = state['dealer_value'] if state['dealer_value'] is not None else '?'
+            print(f"Dealer: {' '.join(state['dealer'])} ({dealer_value})")
+            for i, hand in enumerate(state['hands']):
+                marker = '>' if i == state['active'] else ' '
+                print(f"{marker}Player: {' '.join(hand['cards'])} ({hand['value']})")
+            for result in state['results']:
+                print(result['message'])
+            if state['actions']:
+                print(f"Actions: {', '.join(state['actions'])}")
+            print(f"Balance: ${state['balance']:g}")
+    finally:
+        await client.close()
+
+
+def main():
+    """Command-line entry point for the clients."""
+    parser = argparse.ArgumentParser(description="Blackjack server clients.")
+    parser.add_argument('mode', choices=['play', 'load'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', metavar='PATH', help="connect to a Unix socket")
+    parser.add_argument('--sessions', type=int, default=1000,
+                        help="concurrent bot sessions for load mode")
+    parser.add_argument('--rounds', type=int, default=20,
+                        help="rounds per bot session for load mode")
+    args = parser.parse_args()
+
+    if args.mode == 'play':
+        asyncio.run(interactive(args.host, args.port, args.unix))
+        return
+
+    summary = asyncio.run(load_test(args.sessions, args.rounds, host=args.host,
+                                    port=args.port, unix_path=args.unix))
+    print(f"{summary['sessions']} sessions, {summary['requests']} requests "
+          f"in {summary['seconds']:.2f}s ({summary['requests_per_second']:,.0f} req/s)")
+    print(f"latency p50 {summary['p50_ms']:.3f} ms, p99 {summary['p99_ms']:.3f} ms, "
+          f"max {summary['max_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
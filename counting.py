@@ -0,0 +1,173 @@
+"""
+Card counting for Blackjack.
+A CountTracker attached to a Deck or Shoe keeps the running count of every
+card dealt (one tuple lookup and an integer add per card) under a tag
+system such as Hi-Lo, keeps the dealer's hole card out of the count until
+it is revealed, and derives the true count per deck remaining. A BetRamp
+turns the true count into a bet.
+"""
+
+from bisect import bisect_right
+
+from cards import CARDS
+
+
+class TagSystem:
+    """Count tags for A, 2-9 and ten-valued cards.
+
+    Unbalanced systems (whose tags do not sum to zero over a deck) start
+    each shoe at minus their imbalance per deck, so their count ends the
+    shoe at zero like a balanced count.
+    """
+
+    def __init__(self, name, tags):
+        if len(tags) != 10:
+            raise ValueError("a tag system needs 10 tags: A, 2-9 and ten-valued cards")
+        self.name = name
+        self.tags = tuple(tags)
+        # Tags indexed by Card.index, so counting a card is a single lookup
+        self.card_tags = tuple(self.tags[0] if card.value == 11 else self.tags[card.value - 1]
+                               for card in CARDS)
+        self.imbalance = sum(self.card_tags)
+
+    @property
+    def balanced(self):
+        return self.imbalance == 0
+
+    @classmethod
+    def parse(cls, text, name='custom'):
+        """Parse comma-separated tags for A, 2-9 and ten, e.g. '-1,1,1,1,1,1,0,0,0,-1'."""
+        try:
+            tags = [int(tag) for tag in text.split(',')]
+        except ValueError:
+            raise ValueError(f"invalid tags: {text!r}")
+        return cls(name, tags)
+
+    def __repr__(self):
+        return f"TagSystem({self.name!r}, {self.tags})"
+
+
+HI_LO = TagSystem('hi-lo', (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1))
+
+TAG_SYSTEMS = {system.name: system for system in (
+    HI_LO,
+    TagSystem('hi-opt-1', (0, 0, 1, 1, 1, 1, 0, 0, 0, -1)),
+    TagSystem('hi-opt-2', (0, 1, 1, 2, 2, 1, 1, 0, 0, -2)),
+    TagSystem('omega-2', (0, 1, 1, 2, 2, 2, 1, 0, -1, -2)),
+    TagSystem('zen', (-1, 1, 1, 2, 2, 2, 1, 0, 0, -2)),
+    TagSystem('ko', (-1, 1, 1, 1, 1, 1, 1, 0, 0, -1)),
+)}
+
+
+class CountTracker:
+    """Running and true count of the cards dealt from one Deck or Shoe.
+
+    Attaching the tracker sets deck.tracker; the deck then reports every
+    card it deals and every shuffle. Counting a card allocates nothing.
+    """
+
+    # True counts are estimated to no less than a quarter deck remaining
+    MIN_DECKS_REMAINING = 0.25
+
+    def __init__(self, deck, system=HI_LO):
+        self.system = system
+        self.deck = deck
+        self._tags = system.card_tags
+        self._start = -system.imbalance * getattr(deck, 'decks', 1)
+        self.running = self._start
+        self.hole_card = None
+        deck.tracker = self
+
+    def reset(self):
+        """Start a fresh count after a shuffle."""
+        self.running = self._start
+        self.hole_card = None
+
+    def see(self, card):
+        """Count a card dealt face up."""
+        self.running += self._tags[card.index]
+
+    def hold(self, card):
+        """Take a card dealt face down (the hole card) out of the count until revealed."""
+        self.running -= self._tags[card.index]
+        self.hole_card = card
+
+    def reveal(self):
+        """Count the hole card once it is turned face up."""
+        card = self.hole_card
+        if card is not None:
+            self.running += self._tags[card.index]
+            self.hole_card = None
+
+    @property
+    def decks_remaining(self):
+        """Decks' worth of cards not yet seen, including a face-down hole card."""
+        unseen = self.deck.remaining + (self.hole_card is not None)
+        return max(unseen / len(CARDS), self.MIN_DECKS_REMAINING)
+
+    @property
+    def true_count(self):
+        """Running count per deck remaining."""
+        return self.running / self.decks_remaining
+
+
+class BetRamp:
+    """Bet size in units by true count.
+
+    steps are (true count, units) pairs: the bet is the units of the
+    highest true count reached, or min_units below the first step.
+    """
+
+    def __init__(self, steps=((2, 2), (3, 4), (4, 6), (5, 8)), min_units=1):
+        steps = sorted(steps)
+        self.steps = steps
+        self.min_units = min_units
+        self._counts = [count for count, _ in steps]
+        self._units = [units for _, units in steps]
+
+    def units(self, true_count):
+        """Units to bet at a true count."""
+        i = bisect_right(self._counts, true_count)
+        return self._units[i - 1] if i else self.min_units
+
+    @property
+    def spread(self):
+        """Largest bet over the smallest."""
+        return max(self._units + [self.min_units]) / self.min_units
+
+    @classmethod
+    def parse(cls, text):
+        """Parse 'count:units' pairs, e.g. '2:2,3:4,4:6,5:8'."""
+        try:
+            steps = [tuple(float(part) for part in step.split(':'))
+                     for step in text.split(',')]
+            steps = [(count, int(units)) for count, units in steps]
+        except ValueError:
+            raise ValueError(f"invalid bet ramp: {text!r}")
+        return cls(steps)
+
+    def __repr__(self):
+        return f"BetRamp({self.steps}, min_units={self.min_units})"
+
+
+def add_arguments(parser):
+    """Add command-line options for counting and the bet ramp to an argparse parser."""
+    group = parser.add_argument_group('card counting')
+    group.add_argument('--count', choices=sorted(TAG_SYSTEMS), default=None,
+                       help="count cards with a tag system and bet by the ramp")
+    group.add_argument('--tags', default=None, metavar='TAGS',
+                       help="custom tags for A,2,...,9,10 (implies counting)")
+    group.add_argument('--ramp', default=None, metavar='STEPS',
+                       help="true count:units steps (default: 2:2,3:4,4:6,5:8)")
+
+
+def from_args(args):
+    """(TagSystem or None, BetRamp) from options added by add_arguments."""
+    if args.tags:
+        system = TagSystem.parse(args.tags)
+    elif args.count:
+        system = TAG_SYSTEMS[args.count]
+    else:
+        system = None
+    ramp = BetRamp.parse(args.ramp) if args.ramp else BetRamp()
+    return system, ramp
@@ -0,0 +1,136 @@
+"""
+Exact dealer outcome probabilities for Blackjack.
+Computes the distribution of the dealer's final total (17-21 or bust) for
+each upcard under the game's dealer rule (hit below 17, stand on all 17s),
+given the exact composition of the cards still in the shoe.
+"""
+
+from functools import lru_cache
+
+from cards import CARD_VALUES
+
+
+# Distinct card values (2-11), taken from the Card value mapping
+VALUES = tuple(sorted(set(CARD_VALUES)))
+VALUE_INDEX = {value: i for i, value in enumerate(VALUES)}
+
+# Dealer final totals, in the order used by the distributions below
+FINAL_TOTALS = (17, 18, 19, 20, 21, 'bust')
+BUST_INDEX = len(FINAL_TOTALS) - 1
+
+# Upper bound on memoized (total, soft, composition) states
+CACHE_SIZE = 1 << 18
+
+
+def full_composition(decks=1):
+    """Card counts by value for a full shoe of the given number of decks."""
+    counts = [0] * len(VALUES)
+    for value in CARD_VALUES:
+        counts[VALUE_INDEX[value]] += decks
+    return tuple(counts)
+
+
+def composition_from_cards(cards):
+    """Card counts by value for a collection of cards."""
+    counts = [0] * len(VALUES)
+    for card in cards:
+        counts[VALUE_INDEX[card.value]] += 1
+    return tuple(counts)
+
+
+def remove_cards(composition, cards):
+    """Return the composition with the given cards taken out."""
+    counts = list(composition)
+    for card in cards:
+        counts[VALUE_INDEX[card.value]] -= 1
+    if min(counts) < 0:
+        raise ValueError("cards are not all present in the composition")
+    return tuple(counts)
+
+
+def _add_value(total, soft_aces, value):
+    """Add a card value to a (total, soft Aces) pair, as Hand.get_value does."""
+    total += value
+    if value == 11:
+        soft_aces += 1
+    while total > 21 and soft_aces:
+        total -= 10
+        soft_aces -= 1
+    return total, soft_aces
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _final_distribution(total, soft_aces, composition):
+    """Probability vector over FINAL_TOTALS from a dealer state."""
+    result = [0.0] * len(FINAL_TOTALS)
+    if total > 21:
+        result[BUST_INDEX] = 1.0
+        return tuple(result)
+    if total >= 17:
+        result[total - 17] = 1.0
+        return tuple(result)
+
+    remaining = sum(composition)
+    if remaining == 0:
+        # An empty deck is rebuilt and reshuffled, as in Deck.draw_card
+        composition = full_composition()
+        remaining = sum(composition)
+
+    for i, count in enumerate(composition):
+        if not count:
+            continue
+        p = count / remaining
+        next_total, next_soft = _add_value(total, soft_aces, VALUES[i])
+        next_composition = composition[:i] + (count - 1,) + composition[i + 1:]
+        sub = _final_distribution(next_total, next_soft, next_composition)
+        for j, q in enumerate(sub):
+            result[j] += p * q
+    return tuple(result)
+
+
+def dealer_distribution(upcard, composition):
+    """Distribution of the dealer's final total for an upcard.
+
+    upcard is a Card or a card value; composition is the card counts by
+    value still unseen (not including the upcard). Returns a dict keyed by
+    FINAL_TOTALS.
+    """
+    value = getattr(upcard, 'value', upcard)
+    total, soft_aces = _add_value(0, 0, value)
+    return dict(zip(FINAL_TOTALS, _final_distribution(total, soft_aces,
+                                                      tuple(composition))))
+
+
+def dealer_table(composition=None):
+    """Dealer distributions for every upcard value drawn from composition."""
+    if composition is None:
+        composition = full_composition()
+    table = {}
+    for i, value in enumerate(VALUES):
+        if composition[i]:
+            remaining = composition[:i] + (composition[i] - 1,) + composition[i + 1:]
+            table[value] = dealer_distribution(value, remaining)
+    return table
+
+
+def cache_info():
+    """Hit/miss statistics for the memoized dealer states."""
+    return _final_distribution.cache_info()
+
+
+def clear_cache():
+    """Discard all memoized dealer states."""
+    _final_distribution.cache_clear()
+
+
+def main():
+    """Print the dealer outcome table for a full single deck."""
+    header = 'Up  ' + ''.join(f"{str(total):>8}" for total in FINAL_TOTALS)
+    print(header)
+    for value, dist in dealer_table().items():
+        label = 'A' if value == 11 else str(value)
+        print(f"{label:<4}" + ''.join(f"{dist[total]:8.4f}" for total in FINAL_TOTALS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,553 @@
+"""
+Headless Blackjack round engine.
+Resolves complete rounds synchronously with the Card, Deck and Hand classes,
+so hands can be played without a display or animation timers. Table rules
+(doubling, splits, insurance, surrender, H17/S17, blackjack payout) come
+from a compiled rules.Rules.
+"""
+
+from cards import Deck, Hand, Shoe
+from rules import DEFAULT_RULES, compile_rules
+
+
+# Player actions
+HIT = 'hit'
+STAND = 'stand'
+DOUBLE = 'double'
+SPLIT = 'split'
+SURRENDER = 'surrender'
+INSURANCE = 'insurance'
+ACTION_CODES = {HIT: 'H', STAND: 'S', DOUBLE: 'D', SPLIT: 'P', SURRENDER: 'R',
+                INSURANCE: 'I'}
+CODE_ACTIONS = {code: action for action, code in ACTION_CODES.items()}
+
+# Round outcomes
+BLACKJACK = 'blackjack'
+BLACKJACK_PUSH = 'blackjack_push'
+WIN = 'win'
+DEALER_BUST = 'dealer_bust'
+PUSH = 'push'
+LOSS = 'loss'
+PLAYER_BUST = 'player_bust'
+SURRENDERED = 'surrender'
+
+
+class BetError(ValueError):
+    """A bet that cannot be placed; title is a short heading for the error."""
+
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+
+
+def validate_bet(bet, balance):
+    """Return the bet as an int, or raise BetError if it cannot be placed."""
+    # int() would take true as 1 and truncate 10.7 to 10; only whole amounts
+    # are bets, as in the GUI
+    if isinstance(bet, bool) or (isinstance(bet, float) and not bet.is_integer()):
+        raise BetError("Invalid Bet", "Please enter a valid number!")
+    try:
+        bet = int(bet)
+    except (TypeError, ValueError):
+        raise BetError("Invalid Bet", "Please enter a valid number!")
+    if bet <= 0:
+        raise BetError("Invalid Bet", "Bet must be greater than 0!")
+    if bet > balance:
+        raise BetError("Insufficient Funds", "You don't have enough money!")
+    return bet
+
+
+class RoundResult:
+    """The resolved outcome of one hand of a round.
+
+    bet includes any double. The insurance side bet, if taken, is carried
+    on the round's first hand.
+    """
+
+    __slots__ = ('outcome', 'message', 'payout_multiplier', 'bet',
+                 'player_cards', 'dealer_cards', 'actions', 'insurance',
+                 'insurance_payout')
+
+    def __init__(self, outcome, message, payout_multiplier, bet,
+                 player_cards, dealer_cards, actions=(), insurance=0,
+                 insurance_payout=0):
+        self.outcome = outcome
+        self.message = message
+        self.payout_multiplier = payout_multiplier
+        self.bet = bet
+        self.player_cards = player_cards
+        self.dealer_cards = dealer_cards
+        self.actions = actions
+        self.insurance = insurance
+        self.insurance_payout = insurance_payout
+
+    @property
+    def payout(self):
+        """Total amount returned to the player, including the stake."""
+        return self.bet * self.payout_multiplier + self.insurance_payout
+
+    @property
+    def net(self):
+        """Player's profit or loss for the hand."""
+        return self.payout - self.bet - self.insurance
+
+    def __repr__(self):
+        return (f"RoundResult({self.outcome!r}, bet={self.bet}, "
+                f"payout_multiplier={self.payout_multiplier})")
+
+
+class ReplayRecord:
+    """Everything needed to re-deal and re-play one round.
+
+    A round dealt from a seeded Deck or Shoe is identified by the deck's
+    seed, which shuffle stream was active and how many cards had already
+    been dealt from it; the player's actions then determine the rest.
+    """
+
+    __slots__ = ('seed', 'decks', 'shuffle', 'dealt', 'bet', 'actions')
+
+    def __init__(self, seed, decks, shuffle, dealt, bet, actions):
+        self.seed = seed
+        self.decks = decks  # 0 for a single Deck, otherwise Shoe decks
+        self.shuffle = shuffle
+        self.dealt = dealt
+        self.bet = bet
+        self.actions = actions
+
+    def to_line(self):
+        """Serialize as a single space-separated line."""
+        codes = ''.join(ACTION_CODES[action] for action in self.actions) or '-'
+        return f"{self.seed} {self.decks} {self.shuffle} {self.dealt} {self.bet} {codes}"
+
+    @classmethod
+    def from_line(cls, line):
+        """Parse a line written by to_line."""
+        seed, decks, shuffle, dealt, bet, codes = line.split()
+        bet = float(bet) if '.' in bet else int(bet)
+        actions = [CODE_ACTIONS[code] for code in codes.strip('-')]
+        return cls(seed, int(decks), int(shuffle), int(dealt), bet, actions)
+
+    def __repr__(self):
+        return f"ReplayRecord({self.to_line()!r})"
+
+
+# Preset outcomes that end a hand before the showdown
+DEALER_BLACKJACK = (LOSS, "Dealer has Blackjack!", 0)
+SURRENDER_OUTCOME = (SURRENDERED, "Player Surrenders. Half the bet returned.", 0.5)
+
+
+def natural_outcome(player_hand, dealer_hand, rules=DEFAULT_RULES):
+    """(outcome, message, payout multiplier) for a player blackjack, else None."""
+    if player_hand.is_blackjack():
+        if dealer_hand.is_blackjack():
+            return BLACKJACK_PUSH, "Push! Both have Blackjack!", 1
+        return BLACKJACK, "Blackjack! Player Wins!", rules.blackjack_multiplier
+    return None
+
+
+def bust_outcome(player_hand):
+    """(outcome, message, payout multiplier) if the player busted, else None."""
+    if player_hand.is_busted():
+        return PLAYER_BUST, "Player Busts! Dealer Wins!", 0
+    return None
+
+
+def dealer_should_hit(dealer_hand, rules=DEFAULT_RULES):
+    """Whether the dealer must draw another card (below 17, or soft 17 on H17)."""
+    return rules.dealer_hits[dealer_hand.get_value() + 32 * dealer_hand.is_soft]
+
+
+def showdown_outcome(player_hand, dealer_hand):
+    """(outcome, message, payout multiplier) comparing the final hands."""
+    player_value = player_hand.get_value()
+    dealer_value = dealer_hand.get_value()
+
+    if dealer_hand.is_busted():
+        return DEALER_BUST, "Dealer Busts! Player Wins!", 2
+    elif player_value > dealer_value:
+        return WIN, "Player Wins!", 2
+    elif dealer_value > player_value:
+        return LOSS, "Dealer Wins!", 0
+    else:
+        return PUSH, "Push! It's a Tie!", 1
+
+
+def stand_on_17(player_hand, dealer_upcard):
+    """Default player policy: mimic the dealer and hit below 17."""
+    return HIT if player_hand.get_value() < 17 else STAND
+
+
+class RoundEngine:
+    """Plays Blackjack rounds without any GUI dependencies.
+
+    A round starts with one player hand; splitting adds hands, which are
+    played in order (active is the index of the hand being played). Each
+    hand is resolved into its own RoundResult in results.
+    """
+
+    def __init__(self, deck=None, rng=None, rules=None):
+        # deck may be a Deck or a Shoe; both deal with draw_card()
+        self.rng = rng
+        self.deck = deck if deck is not None else Deck(rng)
+        self.rules = compile_rules(rules)
+        self.player_hand = Hand()
+        self.dealer_hand = Hand()
+        self.hands = [self.player_hand]
+        self.bets = [0]
+        self.bet = 0
+        self.active = 0
+        self.results = []
+        self.actions = []
+        self.insurance = 0
+        self.insurance_open = False
+        self.round_start = (0, 0)
+        self._hand_actions = [[]]
+        self._outcomes = [None]  # preset outcome per hand (bust, surrender...)
+        self._done = [False]
+        self._split_aces = [False]
+
+    @property
+    def round_over(self):
+        """Whether the current round has been resolved."""
+        return bool(self.results)
+
+    @property
+    def result(self):
+        """Result of the round's first (usually only) hand, once resolved."""
+        return self.results[0] if self.results else None
+
+    @property
+    def dealer_upcard(self):
+        """The dealer's face-up card, or None before the deal."""
+        return self.dealer_hand.cards[0] if self.dealer_hand.cards else None
+
+    @property
+    def player_done(self):
+        """Whether every player hand has finished acting."""
+        return self.active >= len(self.hands)
+
+    @property
+    def active_hand(self):
+        """The hand being played, or None once the player's turn is over."""
+        return None if self.player_done or self.results else self.hands[self.active]
+
+    @property
+    def can_hit(self):
+        return (self.active_hand is not None
+                and not (self._split_aces[self.active] and not self.rules.hit_split_aces))
+
+    @property
+    def can_double(self):
+        hand = self.active_hand
+        return (hand is not None and len(hand.cards) == 2
+                and self.rules.can_double[hand.get_value()]
+                and (len(self.hands) == 1 or self.rules.double_after_split)
+                and self.can_hit)
+
+    @property
+    def can_split(self):
+        hand = self.active_hand
+        return (hand is not None and len(hand.cards) == 2
+                and hand.cards[0].value == hand.cards[1].value
+                and len(self.hands) < self.rules.max_hands
+                and (self.rules.resplit_aces or not self._split_aces[self.active]))
+
+    @property
+    def can_surrender(self):
+        hand = self.active_hand
+        return (self.rules.surrender and hand is not None and len(self.hands) == 1
+                and len(hand.cards) == 2
+                and all(action == INSURANCE for action in self.actions))
+
+    def available_actions(self):
+        """The actions the player may take now."""
+        if self.active_hand is None:
+            return ()
+        actions = [STAND]
+        if self.can_hit:
+            actions.insert(0, HIT)
+        if self.can_double:
+            actions.append(DOUBLE)
+        if self.can_split:
+            actions.append(SPLIT)
+        if self.can_surrender:
+            actions.append(SURRENDER)
+        if self.insurance_open:
+            actions.append(INSURANCE)
+        return tuple(actions)
+
+    def reset_deck(self):
+        """Return every card to the deck and reshuffle it."""
+        self.deck.reset()
+
+    def new_round(self, bet=1):
+        """Clear the hands and record the bet for a new round."""
+        self.deck.start_round()
+        self.round_start = (self.deck.shuffles - 1, self.deck.dealt)
+        self.actions = []
+        self.player_hand.clear()
+        self.dealer_hand.clear()
+        self.hands = [self.player_hand]
+        self.bets = [bet]
+        self.bet = bet
+        self.active = 0
+        self.results = []
+        self.insurance = 0
+        self.insurance_open = False
+        self._hand_actions = [[]]
+        self._outcomes = [None]
+        self._done = [False]
+        self._split_aces = [False]
+
+    def initial_deal_order(self):
+        """(hand, face down) for the four opening cards, in dealing order."""
+        return [(self.player_hand, False), (self.dealer_hand, False),
+                (self.player_hand, False), (self.dealer_hand, True)]
+
+    def deal_card(self, hand, hidden=False):
+        """Draw a card from the deck into the given hand and return it.
+
+        A hidden card (the dealer's hole card) stays out of the deck's
+        card count until reveal_hole_card.
+        """
+        card = self.deck.draw_card()
+        hand.add_card(card)
+        if hidden and self.deck.tracker is not None:
+            self.deck.tracker.hold(card)
+        return card
+
+    def deal_initial_cards(self):
+        """Deal the two opening cards to the player and the dealer."""
+        for hand, hidden in self.initial_deal_order():
+            self.deal_card(hand, hidden)
+        return self.check_initial_blackjack()
+
+    def reveal_hole_card(self):
+        """Turn the dealer's hole card face up for any card counter."""
+        if self.deck.tracker is not None:
+            self.deck.tracker.reveal()
+
+    def check_initial_blackjack(self):
+        """Resolve the round on a player blackjack or a dealer peek.
+
+        Against an Ace with insurance offered, the peek waits for the
+        insurance decision (insure or decline_insurance).
+        """
+        outcome = natural_outcome(self.player_hand, self.dealer_hand, self.rules)
+        if outcome:
+            self._outcomes[0] = outcome
+            self.active = 1
+            return self._settle()
+        if self.rules.insurance and self.dealer_upcard.rank == 'A':
+            self.insurance_open = True
+            return None
+        return self._peek()
+
+    def insure(self):
+        """Take insurance for half the bet; returns the result if the dealer peeks a blackjack."""
+        if not self.insurance_open:
+            raise ValueError("insurance is not available")
+        self.insurance = self.bet / 2
+        self._record(INSURANCE)
+        self.insurance_open = False
+        return self._peek()
+
+    def decline_insurance(self):
+        """Turn down insurance; returns the result if the dealer peeks a blackjack."""
+        if not self.insurance_open:
+            return None
+        self.insurance_open = False
+        return self._peek()
+
+    def act(self, action):
+        """Apply one player action by name."""
+        if action == HIT:
+            return self.hit()
+        if action == STAND:
+            return self.stand()
+        if action == DOUBLE:
+            return self.double()
+        if action == SPLIT:
+            return self.split()
+        if action == SURRENDER:
+            return self.surrender()
+        if action == INSURANCE:
+            return self.insure()
+        raise ValueError(f"unknown action: {action!r}")
+
+    def hit(self):
+        """Player draws a card for the active hand; returns the card drawn."""
+        if not self._start_action(HIT, self.can_hit):
+            return None
+        hand = self.hands[self.active]
+        card = self.deal_card(hand)
+        if hand.is_busted():
+            self._finish_hand(bust_outcome(hand))
+        return card
+
+    def stand(self):
+        """Player ends the active hand."""
+        if self._start_action(STAND, self.active_hand is not None):
+            self._finish_hand()
+
+    def double(self):
+        """Double the active hand's bet and draw exactly one more card."""
+        if not self._start_action(DOUBLE, self.can_double):
+            return None
+        hand = self.hands[self.active]
+        self.bets[self.active] *= 2
+        card = self.deal_card(hand)
+        self._finish_hand(bust_outcome(hand))
+        return card
+
+    def split(self):
+        """Split the active pair into two hands, each dealt a second card."""
+        if not self._start_action(SPLIT, self.can_split):
+            return None
+        index = self.active
+        hand = self.hands[index]
+        first, second = hand.cards
+        hand.clear()
+        hand.add_card(first)
+        new_hand = Hand()
+        new_hand.add_card(second)
+
+        aces = first.rank == 'A'
+        self.hands.insert(index + 1, new_hand)
+        self.bets.insert(index + 1, self.bets[index])
+        self._hand_actions.insert(index + 1, [])
+        self._outcomes.insert(index + 1, None)
+        self._done.insert(index + 1, False)
+        self._split_aces[index] = aces
+        self._split_aces.insert(index + 1, aces)
+
+        self.deal_card(hand)
+        self.deal_card(new_hand)
+        if aces and not self.rules.hit_split_aces:
+            # Split Aces take one card each, unless they can be split again
+            for i in (index, index + 1):
+                self._done[i] = not self._can_resplit(self.hands[i])
+            self._advance()
+        return new_hand
+
+    def surrender(self):
+        """Give up the hand for half the bet back."""
+        if not self._start_action(SURRENDER, self.can_surrender):
+            return None
+        self._finish_hand(SURRENDER_OUTCOME)
+        return self.result
+
+    def dealer_should_hit(self):
+        """Whether the dealer must draw another card under the table rules."""
+        return dealer_should_hit(self.dealer_hand, self.rules)
+
+    def dealer_step(self):
+        """Draw one dealer card if required; returns the card or None."""
+        self.reveal_hole_card()
+        if self.dealer_should_hit():
+            return self.deal_card(self.dealer_hand)
+        return None
+
+    def dealer_play(self):
+        """Draw dealer cards until the dealer stands."""
+        self.reveal_hole_card()
+        while self.dealer_should_hit():
+            self.deal_card(self.dealer_hand)
+
+    def determine_winner(self):
+        """Compare the final hands and resolve the round."""
+        return self._settle()
+
+    def play_round(self, bet=1, policy=stand_on_17, insurance=False):
+        """Play a complete round synchronously and return its (first) result.
+
+        The policy is called with the active hand and the dealer's upcard
+        and returns an action: HIT, STAND, or DOUBLE, SPLIT or SURRENDER
+        where the rules allow. insurance says whether to insure when offered.
+        Every hand's result is in results afterwards.
+        """
+        self.new_round(bet)
+        if self.deal_initial_cards() is not None:
+            return self.result
+        if self.insurance_open:
+            if (self.insure() if insurance else self.decline_insurance()) is not None:
+                return self.result
+
+        hands = self.hands
+        while self.active < len(hands):
+            self.act(policy(hands[self.active], self.dealer_upcard))
+        if self.results:
+            return self.result
+
+        self.dealer_play()
+        return self.determine_winner()
+
+    def replay_record(self):
+        """ReplayRecord for the current round; needs a seeded deck."""
+        if self.deck.seed is None:
+            raise ValueError("rounds can only be replayed from a seeded deck")
+        decks = self.deck.decks if isinstance(self.deck, Shoe) else 0
+        shuffle, dealt = self.round_start
+        return ReplayRecord(self.deck.seed, decks, shuffle, dealt, self.bet,
+                            list(self.actions))
+
+    def _peek(self):
+        """With dealer_peeks, end the round at once on a dealer blackjack."""
+        if self.rules.dealer_peeks and self.dealer_hand.is_blackjack():
+            self._outcomes[0] = DEALER_BLACKJACK
+            self.active = 1
+            return self._settle()
+        return None
+
+    def _can_resplit(self, hand):
+        """Whether a freshly split Ace hand may be split again."""
+        return (self.rules.resplit_aces and hand.cards[1].rank == 'A'
+                and len(self.hands) < self.rules.max_hands)
+
+    def _start_action(self, action, allowed):
+        """Close any open insurance offer, validate and record an action.
+
+        Returns False if declining insurance ended the round.
+        """
+        if self.insurance_open:
+            self.decline_insurance()
+            if self.results:
+                return False
+        if not allowed:
+            raise ValueError(f"{action} is not allowed now")
+        self._record(action)
+        return True
+
+    def _record(self, action):
+        self.actions.append(action)
+        self._hand_actions[self.active].append(action)
+
+    def _finish_hand(self, outcome=None):
+        """Mark the active hand finished (outcome None if it faces the dealer)."""
+        self._outcomes[self.active] = outcome
+        self._done[self.active] = True
+        self._advance()
+
+    def _advance(self):
+        """Move to the next unfinished hand; settle if none face the dealer."""
+        while self.active < len(self.hands) and self._done[self.active]:
+            self.active += 1
+        if self.active == len(self.hands) and None not in self._outcomes:
+            self._settle()
+
+    def _settle(self):
+        """Resolve every hand against the dealer and return the first result."""
+        self.reveal_hole_card()
+        dealer = self.dealer_hand
+        dealer_cards = list(dealer.cards)
+        self.results = [
+            RoundResult(*(outcome or showdown_outcome(hand, dealer)), bet,
+                        list(hand.cards), dealer_cards, actions)
+            for hand, bet, outcome, actions in zip(self.hands, self.bets, self._outcomes,
+                                                   self._hand_actions)
+        ]
+        if self.insurance:
+            first = self.results[0]
+            first.insurance = self.insurance
+            first.insurance_payout = 3 * self.insurance if dealer.is_blackjack() else 0
+        return self.results[0]
@@ -0,0 +1,766 @@
+"""
+Tkinter GUI for Blackjack.
+BlackjackGame drives a RoundEngine and animates each step on Tk canvases.
+Imported only when the game window is launched (see blackjack.main), so
+the model, engine and simulator never load Tk.
+"""
+
+import random
+import time
+import tkinter as tk
+from tkinter import messagebox
+import counting
+from cards import Deck
+from engine import (RoundEngine, HIT, DOUBLE, SPLIT, SURRENDER, INSURANCE, BLACKJACK,
+                    BetError, validate_bet)
+from history import HandHistoryWriter
+from replay import append_record
+from sprites import CardSprites, HandRenderer
+from strategy import basic_strategy, recommend
+
+
+# Turbo mode plays hands for up to one frame between display refreshes
+FRAME_MS = 16
+
+# Methods timed when metrics are enabled, by phase label
+PHASES = {
+    '_deal_cards': 'deal',
+    '_deal_cards_animated': 'deal_card',
+    '_check_initial_blackjack': 'check_blackjack',
+    '_hit': 'hit',
+    '_stand': 'stand',
+    '_take_action': 'action',
+    '_continue_round': 'continue',
+    '_dealer_play': 'dealer_step',
+    '_determine_winner': 'determine_winner',
+    '_end_game': 'end_game',
+    '_redraw_hands': 'redraw',
+    '_turbo_tick': 'turbo_tick',
+}
+METRICS_DUMP_MS = 5000
+STORE_FLUSH_MS = 2000
+STARTING_BALANCE = 1000
+
+
+def format_money(amount):
+    """A dollar amount for display: thousands separators, cents only when not whole."""
+    return f"{amount:,.0f}" if amount == int(amount) else f"{amount:,.2f}"
+
+
+class BlackjackGame:
+    """Main game class that controls flow and GUI logic."""
+    
+    def __init__(self, seed=None, replay_path=None, history_path=None, rules=None,
+                 count=None, ramp=None, bet_unit=10, turbo_hands=1000,
+                 turbo_policy=basic_strategy, turbo_refresh=None, metrics=None,
+                 metrics_path=None, store=None, player='player'):
+        self.root = tk.Tk()
+        self.root.title("Blackjack Game")
+        self.root.geometry("900x800")
+        self.root.configure(bg='green')
+        self.root.resizable(True, True)
+        
+        # Rounds can only be replayed from a seeded deck
+        if replay_path and seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.replay_path = replay_path
+        self.history = HandHistoryWriter(history_path) if history_path else None
+        self.engine = RoundEngine(deck=Deck(seed=seed), rules=rules)
+        self.player_hand = self.engine.player_hand
+        self.dealer_hand = self.engine.dealer_hand
+        self.game_over = False
+        self.dealer_hidden = True
+        # A saved bankroll carries over; a busted one starts again
+        self.store = store
+        self.player = player
+        self.balance = store.load_balance(player, STARTING_BALANCE) if store else STARTING_BALANCE
+        if self.balance <= 0:
+            self.balance = STARTING_BALANCE
+        self.session = store.start_session(player, self.balance) if store else None
+        self.current_bet = 0
+        self.animation_speed = 800  # milliseconds
+        self.card_scale = 1.0
+        self.sprites = CardSprites(self.root, self.card_scale)
+        self.renderer = HandRenderer(self.sprites)
+        self._restart_job = None
+        
+        # Card counting: the bet ramp replaces the fixed bet each round
+        self.counter = counting.CountTracker(self.engine.deck, count) if count else None
+        self.ramp = ramp or counting.BetRamp()
+        self.bet_unit = bet_unit
+        
+        # Turbo mode: auto-play hands, refreshing once per frame (or per N hands)
+        self.turbo_hands = turbo_hands
+        self.turbo_policy = turbo_policy
+        self.turbo_refresh = turbo_refresh
+        self._turbo_left = 0
+        self._turbo_played = 0
+        self._turbo_shown = 0
+        self._turbo_bet = 0
+        self._turbo_start = 0.0
+        
+        # Opt-in metrics; instrumenting wraps the phase methods, so it must
+        # happen before the buttons are bound to them
+        self.metrics = metrics
+        self.metrics_path = metrics_path
+        if metrics is not None:
+            metrics.instrument(self, PHASES)
+        
+        self._create_gui()
+        self.root.bind('<Configure>', self._on_resize)
+        self.root.bind('<Control-t>', self._toggle_turbo)
+        self._start_new_game()
+        if metrics_path:
+            self._dump_metrics()
+        if store:
+            self.root.after(STORE_FLUSH_MS, self._flush_store)
+    
+    def _create_gui(self):
+        """Create the GUI elements."""
+        # Title
+        title_label = tk.Label(self.root, text="♠ BLACKJACK ♥", 
+                              font=('Arial', 24, 'bold'), 
+                              fg='white', bg='green')
+        title_label.pack(pady=20)
+        
+        # Balance and betting section
+        money_frame = tk.Frame(self.root, bg='green')
+        money_frame.pack(pady=10)
+        
+        self.balance_label = tk.Label(money_frame, text=f"Balance: ${format_money(self.balance)}", 
+                                     font=('Arial', 16, 'bold'), 
+                                     fg='white', bg='green')
+        self.balance_label.pack(side=tk.LEFT, padx=20)
+        
+        tk.Label(money_frame, text="Bet:", 
+                font=('Arial', 14, 'bold'), 
+                fg='white', bg='green').pack(side=tk.LEFT, padx=10)
+        
+        self.bet_var = tk.StringVar(value="10")
+        self.bet_entry = tk.Entry(money_frame, textvariable=self.bet_var, 
+                                 font=('Arial', 12), width=8)
+        self.bet_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Bet buttons
+        bet_button_frame = tk.Frame(money_frame, bg='green')
+        bet_button_frame.pack(side=tk.LEFT, padx=20)
+        
+        tk.Button(bet_button_frame, text="$10", font=('Arial', 10), 
+                 command=lambda: self._set_bet(10), width=4).pack(side=tk.LEFT, padx=2)
+        tk.Button(bet_button_frame, text="$25", font=('Arial', 10), 
+                 command=lambda: self._set_bet(25), width=4).pack(side=tk.LEFT, padx=2)
+        tk.Button(bet_button_frame, text="$50", font=('Arial', 10), 
+                 command=lambda: self._set_bet(50), width=4).pack(side=tk.LEFT, padx=2)
+        tk.Button(bet_button_frame, text="All-In", font=('Arial', 10), 
+                 command=lambda: self._set_bet(int(self.balance)), width=6).pack(side=tk.LEFT, padx=2)
+        
+        self.current_bet_label = tk.Label(self.root, text="", 
+                                         font=('Arial', 14, 'bold'), 
+                                         fg='yellow', bg='green')
+        self.current_bet_label.pack(pady=5)
+        
+        # Dealer section
+        dealer_frame = tk.Frame(self.root, bg='green')
+        dealer_frame.pack(pady=20)
+        
+        tk.Label(dealer_frame, text="Dealer:", 
+                font=('Arial', 16, 'bold'), 
+                fg='white', bg='green').pack()
+        
+        # Dealer cards canvas
+        self.dealer_canvas = tk.Canvas(dealer_frame, width=700, height=130, 
+                                      bg='green', highlightthickness=0)
+        self.dealer_canvas.pack(pady=10)
+        
+        self.dealer_value_label = tk.Label(dealer_frame, text="", 
+                                          font=('Arial', 14, 'bold'), 
+                                          fg='yellow', bg='green')
+        self.dealer_value_label.pack()
+        
+        # Player section
+        player_frame = tk.Frame(self.root, bg='green')
+        player_frame.pack(pady=20)
+        
+        tk.Label(player_frame, text="Player:", 
+                font=('Arial', 16, 'bold'), 
+                fg='white', bg='green').pack()
+        
+        # Player cards canvas
+        self.player_canvas = tk.Canvas(player_frame, width=700, height=130, 
+                                      bg='green', highlightthickness=0)
+        self.player_canvas.pack(pady=10)
+        
+        self.player_value_label = tk.Label(player_frame, text="", 
+                                          font=('Arial', 14, 'bold'), 
+                                          fg='yellow', bg='green')
+        self.player_value_label.pack()
+        
+        # Buttons
+        button_frame = tk.Frame(self.root, bg='green')
+        button_frame.pack(pady=30)
+        
+        self.deal_button = tk.Button(button_frame, text="Deal", 
+                                    font=('Arial', 14, 'bold'),
+                                    bg='gold', fg='black',
+                                    width=10, command=self._deal_cards)
+        self.deal_button.pack(side=tk.LEFT, padx=10)
+        
+        self.hit_button = tk.Button(button_frame, text="Hit", 
+                                   font=('Arial', 14, 'bold'),
+                                   bg='lightblue', fg='black',
+                                   width=10, command=self._hit)
+        self.hit_button.pack(side=tk.LEFT, padx=10)
+        
+        self.stand_button = tk.Button(button_frame, text="Stand", 
+                                     font=('Arial', 14, 'bold'),
+                                     bg='orange', fg='black',
+                                     width=10, command=self._stand)
+        self.stand_button.pack(side=tk.LEFT, padx=10)
+        
+        self.restart_button = tk.Button(button_frame, text="Reset Game", 
+                                       font=('Arial', 14, 'bold'),
+                                       bg='lightcoral', fg='black',
+                                       width=10, command=self._reset_game)
+        self.restart_button.pack(side=tk.LEFT, padx=10)
+        
+        # Actions allowed by the table rules
+        action_frame = tk.Frame(self.root, bg='green')
+        action_frame.pack()
+        
+        self.action_buttons = {}
+        for action, label, color in ((DOUBLE, "Double", 'lightgreen'),
+                                     (SPLIT, "Split", 'plum'),
+                                     (SURRENDER, "Surrender", 'lightgrey'),
+                                     (INSURANCE, "Insurance", 'khaki')):
+            button = tk.Button(action_frame, text=label, 
+                               font=('Arial', 12, 'bold'),
+                               bg=color, fg='black', width=10, state=tk.DISABLED,
+                               command=lambda a=action: self._take_action(a))
+            button.pack(side=tk.LEFT, padx=10)
+            self.action_buttons[action] = button
+        
+        # Basic strategy hit/stand advice
+        self.hint_label = tk.Label(self.root, text="", 
+                                  font=('Arial', 12, 'italic'), 
+                                  fg='white', bg='green')
+        self.hint_label.pack()
+        
+        # Running and true count, when counting
+        self.count_label = tk.Label(self.root, text="", 
+                                   font=('Arial', 12), 
+                                   fg='white', bg='green')
+        self.count_label.pack()
+        
+        # Game status
+        self.status_label = tk.Label(self.root, text="", 
+                                    font=('Arial', 16, 'bold'), 
+                                    fg='yellow', bg='green')
+        self.status_label.pack(pady=20)
+    
+    def _set_bet(self, amount):
+        """Set the bet amount; bets are whole dollars, as validate_bet requires."""
+        if amount <= self.balance:
+            self.bet_var.set(str(int(amount)))
+    
+    def _place_bet(self):
+        """Place the bet and start the game."""
+        try:
+            bet = validate_bet(self.bet_var.get(), self.balance)
+        except BetError as error:
+            messagebox.showerror(error.title, str(error))
+            return False
+        
+        self.current_bet = bet
+        self.balance -= bet
+        self._update_money_display()
+        return True
+    
+    def _update_money_display(self):
+        """Update balance and bet displays."""
+        self.balance_label.config(text=f"Balance: ${format_money(self.balance)}")
+        if self.current_bet > 0:
+            self.current_bet_label.config(text=f"Current Bet: ${format_money(self.current_bet)}")
+        else:
+            self.current_bet_label.config(text="")
+    
+    def _payout_winnings(self, winnings):
+        """Pay out the amount returned for the round."""
+        self.balance += winnings
+        self._update_money_display()
+    
+    def _check_game_over(self):
+        """Check if player is out of money."""
+        if self.balance <= 0:
+            messagebox.showinfo("Game Over", "You're out of money! Game Over!")
+            self.root.quit()
+            return True
+        return False
+    
+    def _start_new_game(self):
+        """Start a new game (called at initialization)."""
+        if self._check_game_over():
+            return
+            
+        # Reset game state
+        self.engine.reset_deck()
+        self.engine.new_round()
+        self.game_over = False
+        self.dealer_hidden = True
+        self.current_bet = 0
+        
+        # Update displays
+        self._update_display()
+        self._update_money_display()
+        self._enable_betting()
+        self._disable_buttons()
+        self.status_label.config(text="Place your bet and click Deal to start!")
+    
+    def _reset_game(self):
+        """Reset the entire game with fresh balance."""
+        result = messagebox.askyesno("Reset Game", 
+                                   f"This will reset your balance to ${format_money(STARTING_BALANCE)}. Continue?")
+        if result:
+            self.balance = STARTING_BALANCE
+            if self.store:
+                self.store.set_balance(self.player, self.balance)
+            self._start_new_game()
+    
+    def _deal_cards(self):
+        """Deal initial cards after bet is placed."""
+        if not self._place_bet():
+            return
+        
+        self.engine.new_round(self.current_bet)
+        self._disable_betting()
+        self.status_label.config(text="Dealing cards...")
+        
+        # Deal cards with animation
+        self._deal_initial_cards()
+    
+    def _deal_initial_cards(self):
+        """Deal initial cards with animation."""
+        # Player, dealer, player, dealer (the dealer's second card hidden)
+        cards_to_deal = self.engine.initial_deal_order()
+        
+        self._deal_cards_animated(cards_to_deal, 0, self._check_initial_blackjack)
+    
+    def _deal_cards_animated(self, cards_to_deal, index, callback=None):
+        """Deal cards one by one with animation."""
+        if index >= len(cards_to_deal):
+            if callback:
+                callback()
+            return
+        
+        hand, is_hidden = cards_to_deal[index]
+        self.engine.deal_card(hand, is_hidden)
+        
+        # Update display
+        self._update_display()
+        
+        # Schedule next card
+        self._schedule(self.animation_speed, 
+                      lambda: self._deal_cards_animated(cards_to_deal, index + 1, callback))
+    
+    def _check_initial_blackjack(self):
+        """Check for blackjack after initial deal."""
+        result = self.engine.check_initial_blackjack()
+        if result is not None:
+            self._end_game(self.engine.results)
+        else:
+            self._enable_buttons()
+            if self.engine.insurance_open:
+                self.status_label.config(text="Dealer shows an Ace. Insurance?")
+            else:
+                self.status_label.config(text="Choose your action")
+    
+    def _hit(self):
+        """Player draws a card."""
+        if not self.game_over:
+            self._disable_buttons()
+            self.status_label.config(text="Drawing card...")
+            
+            # Add card with animation
+            self.engine.hit()
+            self._update_display()
+            
+            # Check for bust after animation
+            self._schedule(self.animation_speed, self._continue_round)
+    
+    def _stand(self):
+        """Player stands on the current hand."""
+        if not self.game_over:
+            self._disable_buttons()
+            self.engine.stand()
+            self._continue_round()
+    
+    def _take_action(self, action):
+        """Double, split, surrender or insure, staking any extra bet."""
+        if self.game_over:
+            return
+        self._disable_buttons()
+        engine = self.engine
+        if action != INSURANCE:
+            # Acting declines insurance, and the dealer may then peek a blackjack
+            engine.decline_insurance()
+        if not engine.round_over:
+            extra = self._action_cost(action)
+            self.balance -= extra
+            self.current_bet += extra
+            self._update_money_display()
+            engine.act(action)
+        self._update_display()
+        self._schedule(self.animation_speed, self._continue_round)
+    
+    def _action_cost(self, action):
+        """Extra stake an action puts on the table."""
+        if action in (DOUBLE, SPLIT):
+            return self.engine.bets[self.engine.active]
+        if action == INSURANCE:
+            return self.engine.bet / 2
+        return 0
+    
+    def _continue_round(self):
+        """After a player action: next decision, dealer's turn or the result."""
+        engine = self.engine
+        if engine.round_over:
+            self._end_game(engine.results)
+        elif engine.player_done:
+            self._reveal_hole_card()
+            self.status_label.config(text="Dealer's turn...")
+            self._update_display()
+            
+            # Start dealer play with delay
+            self._schedule(self.animation_speed, self._dealer_play)
+        else:
+            self._update_display()
+            self._enable_buttons()
+            if len(engine.hands) > 1:
+                self.status_label.config(
+                    text=f"Hand {engine.active + 1} of {len(engine.hands)}: choose your action")
+            else:
+                self.status_label.config(text="Choose your action")
+    
+    def _dealer_play(self):
+        """Dealer draws cards according to rules with animation."""
+        if self.engine.dealer_step() is not None:
+            # Dealer hit
+            self._update_display()
+            
+            # Continue dealer play after animation
+            self._schedule(self.animation_speed, self._dealer_play)
+        else:
+            # Dealer is done, determine winner
+            self._determine_winner()
+    
+    def _determine_winner(self):
+        """Determine and announce the winner."""
+        self.engine.determine_winner()
+        self._end_game(self.engine.results)
+    
+    def _end_game(self, results):
+        """End the current game and display the result of every hand."""
+        self.game_over = True
+        self._reveal_hole_card()
+        self._update_display()
+        
+        # Calculate winnings
+        winnings = sum(result.payout for result in results)
+        if winnings > 0:
+            self._payout_winnings(winnings)
+        
+        if len(results) == 1:
+            message = self._result_message(results[0])
+        else:
+            message = "  ".join(f"Hand {i + 1}: {result.message}"
+                                for i, result in enumerate(results))
+            net = sum(result.net for result in results)
+            message += f" (net {'+' if net >= 0 else '-'}${format_money(abs(net))})"
+        if results[0].insurance_payout:
+            message += f" Insurance pays ${format_money(results[0].insurance_payout)}."
+        
+        self.status_label.config(text=message)
+        self._disable_buttons()
+        self._record_round(results)
+        
+        # Auto-restart for next round after showing results
+        self._restart_job = self._schedule(3000, self._auto_restart_round)
+    
+    def _reveal_hole_card(self):
+        """Show the dealer's hidden card (and count it)."""
+        self.dealer_hidden = False
+        self.engine.reveal_hole_card()
+    
+    def _record_round(self, results):
+        """Append a finished round to the replay log and hand history."""
+        if self.replay_path:
+            append_record(self.replay_path, self.engine.replay_record())
+        if self.history:
+            self.history.write_results(results)
+        if self.store:
+            self.store.record_round(self.session, self.player, results, self.balance)
+        if self.metrics is not None:
+            self._count_round(results)
+    
+    def _count_round(self, results):
+        """Update the round, hand and card counters."""
+        metrics = self.metrics
+        metrics.counter('rounds_total', "Rounds played").inc()
+        metrics.counter('hands_total', "Player hands played, counting splits").inc(len(results))
+        cards = len(self.dealer_hand.cards) + sum(len(hand.cards) for hand in self.engine.hands)
+        metrics.counter('cards_drawn_total', "Cards dealt").inc(cards)
+    
+    def _schedule(self, delay_ms, callback):
+        """root.after, also measuring how late the callback runs when metrics are on."""
+        if self.metrics is not None:
+            callback = self.metrics.track_lag(delay_ms, callback)
+        return self.root.after(delay_ms, callback)
+    
+    def _flush_store(self):
+        """Commit queued results on a timer, so a quiet table still saves."""
+        self.store.flush()
+        self.root.after(STORE_FLUSH_MS, self._flush_store)
+    
+    def _dump_metrics(self):
+        """Write the metrics file, and again every few seconds."""
+        self.metrics.dump(self.metrics_path)
+        self.root.after(METRICS_DUMP_MS, self._dump_metrics)
+    
+    def _result_message(self, result):
+        """Result message for a single hand, with the amount won or returned."""
+        message = result.message
+        if result.outcome == BLACKJACK:
+            message += f" (Blackjack bonus: +${format_money(result.bet * (result.payout_multiplier - 1))})"
+        elif result.payout_multiplier == 2:
+            message += f" (+${format_money(result.bet)})"
+        elif result.payout_multiplier == 1:
+            message += f" (Bet returned: ${format_money(result.bet)})"
+        return message
+    
+    def _auto_restart_round(self):
+        """Automatically prepare for the next round."""
+        self._restart_job = None
+        # Check if player is out of money first
+        if self._check_game_over():
+            return
+        
+        # Reset for next round
+        self.engine.new_round()
+        self.game_over = False
+        self.dealer_hidden = True
+        self.current_bet = 0
+        
+        # Update displays
+        self._update_display()
+        self._update_money_display()
+        self._enable_betting()
+        self._disable_buttons()
+        self.status_label.config(text="Place your bet and click Deal for next round!")
+    
+    def _update_display(self):
+        """Update the display with current game state."""
+        self._redraw_hands()
+        hands = self.engine.hands
+        if len(hands) == 1:
+            self.player_value_label.config(text=f"Value: {self.player_hand.get_value()}")
+        else:
+            active = self.engine.active_hand
+            self.player_value_label.config(text="   ".join(
+                f"{'▶ ' if hand is active else ''}Hand {i + 1}: {hand.get_value()}"
+                for i, hand in enumerate(hands)))
+        
+        if self.dealer_hidden and len(self.dealer_hand.cards) > 0:
+            self.dealer_value_label.config(text="Value: ?")
+        else:
+            self.dealer_value_label.config(text=f"Value: {self.dealer_hand.get_value()}")
+        
+        self._update_count_display()
+        
+        # Clear status if game is ongoing
+        if not self.game_over:
+            self.status_label.config(text="")
+    
+    def _update_count_display(self):
+        """Show the running and true count and the ramp's next bet."""
+        if self.counter:
+            self.count_label.config(
+                text=f"{self.counter.system.name}  Running count: {self.counter.running:+d}  "
+                     f"True count: {self.counter.true_count:+.1f}  "
+                     f"Next bet: ${format_money(self._ramp_bet())}")
+    
+    def _ramp_bet(self):
+        """The bet ramp's bet at the current true count, capped by the balance."""
+        return min(self.ramp.units(self.counter.true_count) * self.bet_unit,
+                   int(self.balance))
+    
+    def _redraw_hands(self):
+        """Draw both hands, hiding the dealer's second card while required."""
+        if self.metrics is not None:
+            self.metrics.counter('redraws_total', "Hand redraws").inc()
+        self.renderer.draw_hands(self.player_canvas, self.engine.hands)
+        hidden = self.dealer_hidden and len(self.dealer_hand.cards) > 0
+        self._draw_hand(self.dealer_canvas, self.dealer_hand, hidden_first=hidden)
+    
+    def _on_resize(self, event):
+        """Scale the cards with the window and re-render the sprites."""
+        if event.widget is not self.root:
+            return
+        scale = min(event.width / 900, event.height / 800)
+        scale = max(1.0, min(2.0, round(scale * 4) / 4))  # quarter steps
+        if scale == self.card_scale:
+            return
+        
+        self.card_scale = scale
+        self.sprites.set_scale(scale)
+        for canvas in (self.dealer_canvas, self.player_canvas):
+            canvas.config(width=round(700 * scale), height=round(130 * scale))
+        self.renderer.forget()
+        self._redraw_hands()
+    
+    def _enable_buttons(self):
+        """Enable the buttons for every action the rules allow and the balance covers."""
+        actions = self.engine.available_actions()
+        self.hit_button.config(state=tk.NORMAL if HIT in actions else tk.DISABLED)
+        self.stand_button.config(state=tk.NORMAL)
+        for action, button in self.action_buttons.items():
+            allowed = action in actions and self._action_cost(action) <= self.balance
+            button.config(state=tk.NORMAL if allowed else tk.DISABLED)
+        self.deal_button.config(state=tk.DISABLED)
+        self._update_hint()
+    
+    def _disable_buttons(self):
+        """Disable every player action button."""
+        self.hit_button.config(state=tk.DISABLED)
+        self.stand_button.config(state=tk.DISABLED)
+        for button in self.action_buttons.values():
+            button.config(state=tk.DISABLED)
+        self.hint_label.config(text="")
+    
+    def _update_hint(self):
+        """Show the basic strategy's hit/stand advice for the current hand."""
+        hand = self.engine.active_hand or self.player_hand
+        action = recommend(hand, self.engine.dealer_upcard)
+        # The strategy table only weighs hitting against standing
+        text = f"Hit/Stand advice: {'Hit' if action == HIT else 'Stand'}"
+        if self.engine.can_double or self.engine.can_split:
+            text += " (double and split not covered)"
+        self.hint_label.config(text=text)
+    
+    def _enable_betting(self):
+        """Enable betting controls, with the ramp's bet when counting."""
+        if self.counter:
+            self.bet_var.set(str(self._ramp_bet()))
+        self.deal_button.config(state=tk.NORMAL)
+        self.bet_entry.config(state=tk.NORMAL)
+    
+    def _disable_betting(self):
+        """Disable betting controls."""
+        self.deal_button.config(state=tk.DISABLED)
+        self.bet_entry.config(state=tk.DISABLED)
+    
+    def _draw_card_visual(self, canvas, card, x, y, hidden=False, tags=()):
+        """Draw a card (or the card back) as a single cached sprite."""
+        return self.renderer.draw_card(canvas, card, x, y, hidden=hidden, tags=tags)
+    
+    def _draw_hand(self, canvas, hand, hidden_first=False):
+        """Draw all cards in a hand on the canvas, reusing unchanged items."""
+        self.renderer.draw_hand(canvas, hand, hidden_first=hidden_first)
+    
+    def _toggle_turbo(self, event=None):
+        """Hotkey: start turbo mode between rounds, or stop it."""
+        if self._turbo_left:
+            self._turbo_left = 0  # the next tick finishes
+        else:
+            self.start_turbo(self.turbo_hands)
+    
+    def start_turbo(self, hands):
+        """Auto-play hands with the turbo policy and no animation.
+        
+        Only starts between rounds. Bets the current bet (or the ramp's bet
+        when counting) every hand.
+        """
+        if self._turbo_left or not (self.game_over or not self.player_hand.cards):
+            return
+        if not self.counter:
+            try:
+                self._turbo_bet = validate_bet(self.bet_var.get(), self.balance)
+            except BetError as error:
+                messagebox.showerror(error.title, str(error))
+                return
+        if self._restart_job is not None:
+            self.root.after_cancel(self._restart_job)
+            self._restart_job = None
+        
+        self._turbo_left = hands
+        self._turbo_played = 0
+        self._turbo_shown = 0
+        self._turbo_start = time.perf_counter()
+        self.game_over = True  # no round is waiting on the buttons
+        self._disable_betting()
+        self._disable_buttons()
+        self.restart_button.config(state=tk.DISABLED)
+        self._schedule(1, self._turbo_tick)
+    
+    def _turbo_tick(self):
+        """Play hands for one frame, then refresh the display at most once."""
+        clock = time.perf_counter
+        deadline = clock() + FRAME_MS / 1000
+        while self._turbo_left:
+            if not self._turbo_hand():
+                self._turbo_left = 0  # out of money
+                break
+            self._turbo_left -= 1
+            self._turbo_played += 1
+            if clock() >= deadline:
+                break
+        
+        if (not self._turbo_left or self.turbo_refresh is None
+                or self._turbo_played - self._turbo_shown >= self.turbo_refresh):
+            self._refresh_turbo()
+        if self._turbo_left:
+            self._schedule(1, self._turbo_tick)
+        else:
+            self._finish_turbo()
+    
+    def _turbo_hand(self):
+        """Play one hand headlessly; returns False if no bet can be placed."""
+        bet = self._ramp_bet() if self.counter else min(self._turbo_bet, int(self.balance))
+        if bet < 1:
+            return False
+        engine = self.engine
+        engine.play_round(bet, self.turbo_policy)
+        self.current_bet = bet
+        self.balance += sum(result.net for result in engine.results)
+        self._record_round(engine.results)
+        return True
+    
+    def _refresh_turbo(self):
+        """Redraw the last hand, the balance and the hands/sec counter."""
+        self._turbo_shown = self._turbo_played
+        self.dealer_hidden = False
+        self._update_display()
+        self._update_money_display()
+        self.status_label.config(text=f"Turbo: {self._turbo_played} hands, "
+                                      f"{self._turbo_rate():,.0f} hands/sec (Ctrl+T to stop)")
+    
+    def _turbo_rate(self):
+        elapsed = time.perf_counter() - self._turbo_start
+        return self._turbo_played / elapsed if elapsed > 0 else 0.0
+    
+    def _finish_turbo(self):
+        """Return to betting after a turbo run."""
+        played, rate = self._turbo_played, self._turbo_rate()
+        self.restart_button.config(state=tk.NORMAL)
+        self._auto_restart_round()
+        if self.balance > 0:
+            self.status_label.config(text=f"Turbo played {played} hands "
+                                          f"({rate:,.0f} hands/sec). Place your bet!")
+    
+    def run(self):
+        """Start the game loop."""
+        self.root.mainloop()
+        if self.history:
+            self.history.close()
+        if self.store:
+            self.store.close()
+        if self.metrics_path:
+            self.metrics.dump(self.metrics_path)
@@ -0,0 +1,248 @@
+"""
+Binary hand-history log.
+Every finished round is appended as one length-prefixed record: outcome,
+bet, balance delta, the cards each hand was dealt (one byte per card, the
+card's index) and the player's actions. Writes are buffered and flushed
+in blocks; the reader memory-maps the file and yields records lazily.
+
+File layout (little-endian):
+    b'BJHH' + version byte, then records of
+    uint16 body length
+    uint8 outcome, uint32 bet, int32 net in cents (half chips in version 1),
+    uint8 player cards, uint8 dealer cards, uint8 actions,
+    uint8 flags (version 3; CONTINUES_ROUND, SPLIT_HAND),
+    player card bytes, dealer card bytes, action code bytes (b'H', b'S', ...)
+
+The dealer's first two cards are the initial deal; any after that are
+dealer draws. A split round is written as one record per hand, each
+flagged SPLIT_HAND and every hand after the first CONTINUES_ROUND; bet
+includes any double and net includes insurance, carried on the first hand.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+
+from cards import CARDS
+from engine import ACTION_CODES, CODE_ACTIONS
+from simulate import OUTCOMES
+
+
+MAGIC = b'BJHH'
+VERSION = 3
+# Stored net per chip, by format version; cents cover 6:5 payouts and insurance
+NET_SCALES = {1: 2, 2: 100, 3: 100}
+HEADER = MAGIC + bytes([VERSION])
+BLOCK_SIZE = 1 << 16
+
+# Record flags
+CONTINUES_ROUND = 1  # another hand of the same round as the previous record
+SPLIT_HAND = 2  # one of the hands a pair was split into
+
+_LENGTH = struct.Struct('<H')
+_FIXED = struct.Struct('<BIiBBBB')
+_FIXED_V2 = struct.Struct('<BIiBBB')  # versions 1 and 2 have no flags
+FIXED_SIZE = _FIXED.size  # a record body's fields before its card bytes
+# Size of those fields by format version
+FIXED_SIZES = {1: _FIXED_V2.size, 2: _FIXED_V2.size, 3: _FIXED.size}
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(OUTCOMES)}
+_ACTION_BYTES = {action: ord(code) for action, code in ACTION_CODES.items()}
+_BYTE_ACTIONS = {ord(code): action for code, action in CODE_ACTIONS.items()}
+
+
+class HandRecord:
+    """One hand read back from a hand-history log."""
+
+    __slots__ = ('outcome', 'bet', 'net', 'player_cards', 'dealer_cards', 'actions',
+                 'flags')
+
+    def __init__(self, outcome, bet, net, player_cards, dealer_cards, actions, flags=0):
+        self.outcome = outcome
+        self.bet = bet
+        self.net = net
+        self.player_cards = player_cards
+        self.dealer_cards = dealer_cards
+        self.actions = actions
+        self.flags = flags
+
+    @property
+    def continues_round(self):
+        """Whether this hand belongs to the same round as the previous record."""
+        return bool(self.flags & CONTINUES_ROUND)
+
+    @property
+    def split(self):
+        """Whether this hand was split from a pair."""
+        return bool(self.flags & SPLIT_HAND)
+
+    @property
+    def dealer_draws(self):
+        """Cards the dealer drew after the initial deal."""
+        return self.dealer_cards[2:]
+
+    def __repr__(self):
+        return (f"HandRecord({self.outcome!r}, bet={self.bet}, net={self.net:+g}, "
+                f"player={self.player_cards}, dealer={self.dealer_cards})")
+
+
+def encode_round(result, actions, flags=0):
+    """Encode a RoundResult and the player's actions as one record."""
+    player = bytes(card.index for card in result.player_cards)
+    dealer = bytes(card.index for card in result.dealer_cards)
+    codes = bytes(_ACTION_BYTES[action] for action in actions)
+    body = (_FIXED.pack(_OUTCOME_CODES[result.outcome], int(result.bet),
+                        round(result.net * NET_SCALES[VERSION]),
+                        len(player), len(dealer), len(codes), flags)
+            + player + dealer + codes)
+    return _LENGTH.pack(len(body)) + body
+
+
+class HandHistoryWriter:
+    """Appends rounds to a hand-history log, flushing in blocks."""
+
+    def __init__(self, path, block_size=BLOCK_SIZE):
+        self.path = path
+        self.block_size = block_size
+        self.rounds_written = 0
+        self._buffer = bytearray()
+        self._file = open(path, 'ab')
+        if self._file.tell() == 0:
+            self._buffer += HEADER
+        else:
+            with open(path, 'rb') as f:
+                header = f.read(len(HEADER))
+            if header != HEADER:
+                self._file.close()
+                raise ValueError(f"{path} is not a version {VERSION} hand-history log")
+
+    def write_round(self, result, actions=None, flags=0):
+        """Buffer one finished hand."""
+        self._buffer += encode_round(result, result.actions if actions is None else actions,
+                                     flags)
+        self.rounds_written += not flags & CONTINUES_ROUND
+
+    def write_results(self, results):
+        """Buffer every hand of a round (several after a split); flushes when a block has filled."""
+        split = SPLIT_HAND if len(results) > 1 else 0
+        for i, result in enumerate(results):
+            self.write_round(result, flags=split | (CONTINUES_ROUND if i else 0))
+        if len(self._buffer) >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered records to disk."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def check_header(data, path):
+    """Return the log's format version; ValueError unless it is a hand-history log."""
+    if bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{path} is not a hand-history log")
+    version = data[len(MAGIC)]
+    if version not in NET_SCALES:
+        raise ValueError(f"unsupported hand-history version {version}")
+    return version
+
+
+def scan_records(data, pos=len(HEADER), limit=None):
+    """Find the complete records in data from byte offset pos.
+
+    Returns (body offsets, next pos): the offset of each record body (just
+    past its length prefix), and where the next unread record starts.
+    """
+    unpack_length = _LENGTH.unpack_from
+    length_size = _LENGTH.size
+    end = len(data)
+    offsets = []
+    while pos + length_size <= end and (limit is None or len(offsets) < limit):
+        (length,) = unpack_length(data, pos)
+        if pos + length_size + length > end:
+            break  # partially written final record
+        offsets.append(pos + length_size)
+        pos += length_size + length
+    return offsets, pos
+
+
+def read_history(path):
+    """Yield the HandRecords in a hand-history log without loading it whole."""
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        version = check_header(data, path)
+        net_scale = NET_SCALES[version]
+        fixed = _FIXED if version >= 3 else _FIXED_V2
+
+        unpack_length = _LENGTH.unpack_from
+        unpack_fixed = fixed.unpack_from
+        length_size = _LENGTH.size
+        fixed_size = fixed.size
+        cards = CARDS
+        end = len(data)
+        pos = len(HEADER)
+        while pos + length_size <= end:
+            (length,) = unpack_length(data, pos)
+            pos += length_size
+            if pos + length > end:
+                break  # partially written final record
+            outcome, bet, scaled_net, n_player, n_dealer, n_actions, *flags = unpack_fixed(
+                data, pos)
+            start = pos + fixed_size
+            middle = start + n_player
+            stop = middle + n_dealer
+            yield HandRecord(
+                OUTCOMES[outcome], bet, scaled_net / net_scale,
+                [cards[i] for i in data[start:middle]],
+                [cards[i] for i in data[middle:stop]],
+                [_BYTE_ACTIONS[c] for c in data[stop:stop + n_actions]],
+                flags[0] if flags else 0,
+            )
+            pos += length
+
+
+def main():
+    """Summarize (and optionally print) the rounds in a hand-history log."""
+    parser = argparse.ArgumentParser(description="Read a Blackjack hand-history log.")
+    parser.add_argument('log')
+    parser.add_argument('--print', type=int, default=0, metavar='N', dest='show',
+                        help="also print the first N hands")
+    args = parser.parse_args()
+
+    counts = dict.fromkeys(OUTCOMES, 0)
+    rounds = 0
+    hands = 0
+    net = 0.0
+    wagered = 0
+    for record in read_history(args.log):
+        if hands < args.show:
+            player = ' '.join(str(card) for card in record.player_cards)
+            dealer = ' '.join(str(card) for card in record.dealer_cards)
+            print(f"{player:<20} | {dealer:<20} | {record.outcome} (net {record.net:+g})")
+        counts[record.outcome] += 1
+        hands += 1
+        rounds += not record.continues_round
+        net += record.net
+        wagered += record.bet
+
+    print(f"Rounds: {rounds}  Hands: {hands}")
+    for outcome in OUTCOMES:
+        print(f"  {outcome:<15} {counts[outcome]}")
+    print(f"Wagered: {wagered}  Net: {net:+g}")
+
+
+if __name__ == "__main__":
+    main()
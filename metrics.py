@@ -0,0 +1,220 @@
+"""
+In-process metrics for Blackjack.
+A MetricsRegistry holds counters and latency histograms and exports them
+as Prometheus text or JSON, to a file or over HTTP on a local port.
+Instrumentation is opt-in: instrument() wraps an object's methods only
+when a registry is in use, so a game without metrics runs its original
+methods untouched.
+"""
+
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Upper bounds in seconds, from sub-millisecond logic to multi-second stalls
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Counter:
+    """A monotonically increasing count."""
+
+    kind = 'counter'
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def snapshot(self):
+        return {'value': self.value}
+
+
+class Histogram:
+    """Counts of observed values in fixed buckets, plus their sum."""
+
+    kind = 'histogram'
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # the last is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th quantile (inf if beyond the last)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float('inf')
+
+    def cumulative(self):
+        """(upper bound, observations at or below it) for every bucket and +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def snapshot(self):
+        return {'count': self.count, 'sum': self.sum,
+                'p50': self.quantile(0.5), 'p99': self.quantile(0.99),
+                'buckets': {_format_bound(bound): total
+                            for bound, total in self.cumulative()}}
+
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in pairs) + '}'
+
+
+class MetricsRegistry:
+    """Named, optionally labelled counters and histograms."""
+
+    def __init__(self, prefix='blackjack_'):
+        self.prefix = prefix
+        # name -> (kind, help, {labels: metric}); the exporter thread reads it while
+        # the game registers metrics on first use, so readers iterate over copies
+        self._families = {}
+
+    def _get(self, cls, name, help_text, labels, *args):
+        name = self.prefix + name
+        kind, _, metrics = self._families.setdefault(name, (cls.kind, help_text, {}))
+        if kind != cls.kind:
+            raise ValueError(f"{name} is already registered as a {kind}")
+        key = tuple(sorted(labels.items()))
+        metric = metrics.get(key)
+        if metric is None:
+            metric = metrics[key] = cls(*args)
+        return metric
+
+    def counter(self, name, help_text='', **labels):
+        """The counter with this name and labels, created on first use."""
+        return self._get(Counter, name, help_text, labels)
+
+    def histogram(self, name, help_text='', buckets=LATENCY_BUCKETS, **labels):
+        """The histogram with this name and labels, created on first use."""
+        return self._get(Histogram, name, help_text, labels, buckets)
+
+    def timed(self, function, histogram):
+        """Wrap function so every call's duration is observed in histogram."""
+        clock = time.perf_counter
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(clock() - start)
+        return wrapper
+
+    def instrument(self, obj, phases, name='phase_seconds',
+                   help_text="Time spent in each phase of a round"):
+        """Replace obj's methods with timed wrappers.
+
+        phases maps method names to phase labels; each phase gets its own
+        histogram in the name family.
+        """
+        for method, phase in phases.items():
+            histogram = self.histogram(name, help_text, phase=phase)
+            setattr(obj, method, self.timed(getattr(obj, method), histogram))
+
+    def track_lag(self, delay_ms, callback, name='after_lag_seconds',
+                  help_text="How late scheduled callbacks ran"):
+        """Wrap a callback scheduled delay_ms from now to observe how late it runs."""
+        clock = time.perf_counter
+        due = clock() + delay_ms / 1000
+        histogram = self.histogram(name, help_text)
+
+        def run(*args):
+            histogram.observe(max(0.0, clock() - due))
+            return callback(*args)
+        return run
+
+    def to_prometheus(self):
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, (kind, help_text, metrics) in list(self._families.items()):
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, metric in list(metrics.items()):
+                if kind == 'counter':
+                    lines.append(f"{name}{_format_labels(labels)} {metric.value}")
+                    continue
+                for bound, total in metric.cumulative():
+                    le = (('le', _format_bound(bound)),)
+                    lines.append(f"{name}_bucket{_format_labels(labels, le)} {total}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {metric.sum!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {metric.count}")
+        return '\n'.join(lines) + '\n'
+
+    def to_json(self):
+        """All metrics as a JSON document, with p50/p99 bucket estimates."""
+        families = {}
+        for name, (kind, help_text, metrics) in list(self._families.items()):
+            families[name] = {
+                'type': kind,
+                'help': help_text,
+                'samples': [dict(metric.snapshot(), labels=dict(labels))
+                            for labels, metric in list(metrics.items())],
+            }
+        return json.dumps(families, indent=2)
+
+    def dump(self, path):
+        """Write the metrics to a file: JSON for a .json path, else Prometheus text."""
+        text = self.to_json() if path.endswith('.json') else self.to_prometheus()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def serve(self, port, host='127.0.0.1'):
+        """Serve the metrics over HTTP from a background thread.
+
+        GET /metrics.json returns JSON; any other path returns Prometheus
+        text. Returns the server; call shutdown() to stop it.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.endswith('.json'):
+                    body, content_type = registry.to_json(), 'application/json'
+                else:
+                    body, content_type = registry.to_prometheus(), 'text/plain; version=0.0.4'
+                body = body.encode()
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server
@@ -0,0 +1,158 @@
+"""
+Multi-table Blackjack practice window.
+Shows several tables of 1-7 seats in one tkinter window. Bot seats play
+basic strategy and human seats use the table's Hit/Stand buttons; every
+table is stepped and redrawn from one shared Scheduler tick.
+"""
+
+import argparse
+import math
+import tkinter as tk
+
+from cards import Shoe, stream_seed
+from engine import HIT, STAND
+from rules import Rules
+from scheduler import Scheduler
+from sprites import CardSprites, HandRenderer
+from strategy import basic_strategy
+from table import Table, Seat
+
+
+class TableView:
+    """The widgets for one table."""
+
+    def __init__(self, parent, title, table, renderer, scheduler):
+        self.table = table
+        self.renderer = renderer
+        self.scheduler = scheduler
+        scale = renderer.sprites.scale
+        canvas_width = round(500 * scale)
+        canvas_height = round(120 * scale)
+
+        self.frame = tk.Frame(parent, bg='green', bd=2, relief=tk.GROOVE)
+        tk.Label(self.frame, text=title, font=('Arial', 12, 'bold'),
+                 fg='white', bg='green').pack()
+
+        self.dealer_label = tk.Label(self.frame, text="Dealer", font=('Arial', 10, 'bold'),
+                                     fg='yellow', bg='green')
+        self.dealer_label.pack()
+        self.dealer_canvas = tk.Canvas(self.frame, width=canvas_width, height=canvas_height,
+                                       bg='green', highlightthickness=0)
+        self.dealer_canvas.pack()
+
+        self.seat_labels = []
+        self.seat_canvases = []
+        for _ in table.seats:
+            label = tk.Label(self.frame, text="", font=('Arial', 10),
+                             fg='white', bg='green')
+            label.pack()
+            canvas = tk.Canvas(self.frame, width=canvas_width, height=canvas_height,
+                               bg='green', highlightthickness=0)
+            canvas.pack()
+            self.seat_labels.append(label)
+            self.seat_canvases.append(canvas)
+
+        self.hit_button = self.stand_button = None
+        if any(seat.is_human for seat in table.seats):
+            button_frame = tk.Frame(self.frame, bg='green')
+            button_frame.pack(pady=5)
+            self.hit_button = tk.Button(button_frame, text="Hit", font=('Arial', 10, 'bold'),
+                                        bg='lightblue', width=8,
+                                        command=lambda: self._act(HIT))
+            self.hit_button.pack(side=tk.LEFT, padx=5)
+            self.stand_button = tk.Button(button_frame, text="Stand", font=('Arial', 10, 'bold'),
+                                          bg='orange', width=8,
+                                          command=lambda: self._act(STAND))
+            self.stand_button.pack(side=tk.LEFT, padx=5)
+
+    def _act(self, action):
+        """Apply a human decision and let the scheduler continue the table."""
+        if self.table.act(action):
+            self.scheduler.wake(self.table)
+
+    def refresh(self):
+        """Redraw the table from its current state."""
+        table = self.table
+        dealer = table.dealer_hand
+        hidden = table.dealer_hidden and len(dealer.cards) > 0
+        self.renderer.draw_hand(self.dealer_canvas, dealer, hidden_first=hidden)
+        value = "?" if hidden else dealer.get_value()
+        self.dealer_label.config(text=f"Dealer: {value}")
+
+        active = table.active_seat
+        for i, seat in enumerate(table.seats):
+            self.renderer.draw_hand(self.seat_canvases[i], seat.hand)
+            who = "You" if seat.is_human else "Bot"
+            marker = "▶ " if seat is active else ""
+            if seat.result is not None:
+                status = seat.result.message
+            elif seat.current_bet:
+                status = f"Value: {seat.hand.get_value()}"
+            else:
+                status = "Sitting out"
+            self.seat_labels[i].config(
+                text=f"{marker}Seat {i + 1} ({who}) ${seat.balance:g} - {status}")
+
+        if self.hit_button is not None:
+            state = tk.NORMAL if table.waiting_for_human else tk.DISABLED
+            self.hit_button.config(state=state)
+            self.stand_button.config(state=state)
+
+
+class MultiTableApp:
+    """Several tables in one window, driven by a single scheduler."""
+
+    def __init__(self, tables=4, seats=3, human_seats=0, decks=6, seed=None,
+                 scale=0.6, deal_delay=0.8, result_delay=3.0, rules=None):
+        self.root = tk.Tk()
+        self.root.title("Blackjack Tables")
+        self.root.configure(bg='green')
+
+        self.scheduler = Scheduler(self.root)
+        self.renderer = HandRenderer(CardSprites(self.root, scale))
+        self.views = {}
+
+        columns = math.ceil(math.sqrt(tables))
+        for t in range(tables):
+            table_seats = [Seat(policy=None if s < human_seats else basic_strategy)
+                           for s in range(seats)]
+            shoe = Shoe(decks, seed=None if seed is None else stream_seed(seed, t))
+            table = Table(table_seats, shoe, deal_delay, result_delay, rules)
+            view = TableView(self.root, f"Table {t + 1}", table, self.renderer,
+                             self.scheduler)
+            view.frame.grid(row=t // columns, column=t % columns, padx=5, pady=5)
+            self.views[table] = view
+            self.scheduler.add_table(table)
+
+        self.scheduler.add_listener(self._refresh)
+
+    def _refresh(self, changed):
+        for table in changed:
+            self.views[table].refresh()
+
+    def run(self):
+        """Start the scheduler and the Tk event loop."""
+        self.scheduler.start()
+        self.root.mainloop()
+
+
+def main():
+    """Command-line entry point for the multi-table window."""
+    parser = argparse.ArgumentParser(description="Play several Blackjack tables at once.")
+    parser.add_argument('--tables', type=int, default=4)
+    parser.add_argument('--seats', type=int, default=3, help="seats per table (1-7)")
+    parser.add_argument('--human-seats', type=int, default=1,
+                        help="seats per table played with the Hit/Stand buttons")
+    parser.add_argument('--decks', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--scale', type=float, default=0.6, help="card size")
+    Rules.add_arguments(parser, hit_stand_only=True)
+    args = parser.parse_args()
+
+    app = MultiTableApp(args.tables, args.seats, args.human_seats, args.decks,
+                        args.seed, args.scale, rules=Rules.from_args(args))
+    app.run()
+
+
+if __name__ == "__main__":
+    main()
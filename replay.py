@@ -0,0 +1,71 @@
+"""
+Deterministic replay of Blackjack rounds.
+Reads and writes replay logs of ReplayRecord lines and re-runs recorded
+rounds through the headless RoundEngine on identical card sequences.
+"""
+
+import argparse
+
+from cards import Deck, Shoe
+from engine import RoundEngine, ReplayRecord, INSURANCE
+from rules import Rules
+
+
+def append_record(path, record):
+    """Append one ReplayRecord to a replay log."""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(record.to_line() + '\n')
+
+
+def read_log(path):
+    """Yield the ReplayRecords in a replay log."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield ReplayRecord.from_line(line)
+
+
+def replay_deck(record):
+    """A seeded Deck or Shoe positioned at the start of a recorded round."""
+    if record.decks:
+        # Full penetration: the recorded position already reflects any
+        # reshuffle that happened at the round boundary.
+        deck = Shoe(record.decks, 1.0, seed=record.seed)
+    else:
+        deck = Deck(seed=record.seed)
+    deck.seek(record.shuffle, record.dealt)
+    return deck
+
+
+def replay_round(record, rules=None):
+    """Re-run a recorded round and return its RoundResults, one per hand.
+
+    The round must be replayed under the rules it was played with.
+    """
+    engine = RoundEngine(deck=replay_deck(record), rules=rules)
+    actions = list(record.actions)
+    insured = actions[:1] == [INSURANCE]
+    if insured:
+        del actions[0]
+    actions = iter(actions)
+    engine.play_round(record.bet, lambda hand, upcard: next(actions), insured)
+    return engine.results
+
+
+def main():
+    """Replay every round in a log and print the results."""
+    parser = argparse.ArgumentParser(description="Replay recorded Blackjack rounds.")
+    parser.add_argument('log', help="replay log written by the game or simulator")
+    Rules.add_arguments(parser)
+    args = parser.parse_args()
+    rules = Rules.from_args(args)
+
+    for record in read_log(args.log):
+        for result in replay_round(record, rules):
+            player = ' '.join(str(card) for card in result.player_cards)
+            dealer = ' '.join(str(card) for card in result.dealer_cards)
+            print(f"{player:<20} | {dealer:<20} | {result.message} (net {result.net:+g})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Table rules for Blackjack.
+Rules describes a table's variant (dealer hits or stands on soft 17, the
+blackjack payout, doubling, splitting, insurance and surrender) and
+compiles it into CompiledRules: flat flags and lookup tables the engine
+reads directly, so a rule variant costs nothing extra per hand.
+"""
+
+
+# Two-card totals a player may double on, by Rules.double_on
+DOUBLE_TOTALS = {
+    'any': range(4, 22),
+    '9-11': range(9, 12),
+    '10-11': range(10, 12),
+    'none': range(0),
+}
+
+
+def parse_payout(text):
+    """Parse a blackjack payout such as '3:2', '6:5' or '1.5' into a float."""
+    if isinstance(text, (int, float)):
+        return float(text)
+    if ':' in text:
+        win, stake = text.split(':')
+        return int(win) / int(stake)
+    return float(text)
+
+
+class CompiledRules:
+    """Rules flattened into the flags and tables RoundEngine looks up."""
+
+    __slots__ = ('blackjack_multiplier', 'dealer_hits', 'can_double',
+                 'double_after_split', 'max_hands', 'resplit_aces',
+                 'hit_split_aces', 'insurance', 'surrender', 'dealer_peeks')
+
+
+class Rules:
+    """A table's rule variant; the defaults are S17 and 3:2 with double, split and insurance."""
+
+    MAX_SPLIT_HANDS = 8
+
+    def __init__(self, dealer_hits_soft_17=False, blackjack_payout=1.5,
+                 double_on='any', double_after_split=True, max_split_hands=4,
+                 resplit_aces=False, hit_split_aces=False, insurance=True,
+                 surrender=False, dealer_peeks=False):
+        if double_on not in DOUBLE_TOTALS:
+            raise ValueError(f"double_on must be one of {', '.join(DOUBLE_TOTALS)}")
+        if not 1 <= max_split_hands <= self.MAX_SPLIT_HANDS:
+            raise ValueError(f"max_split_hands must be between 1 and {self.MAX_SPLIT_HANDS}")
+        blackjack_payout = parse_payout(blackjack_payout)
+        if blackjack_payout < 1:
+            raise ValueError("a blackjack must pay at least even money")
+        if surrender and not dealer_peeks:
+            # Surrender is late surrender: only offered once the dealer has checked
+            raise ValueError("surrender needs a dealer peek for blackjack")
+        self.dealer_hits_soft_17 = dealer_hits_soft_17
+        self.blackjack_payout = blackjack_payout
+        self.double_on = double_on
+        self.double_after_split = double_after_split
+        self.max_split_hands = max_split_hands
+        self.resplit_aces = resplit_aces
+        self.hit_split_aces = hit_split_aces
+        self.insurance = insurance
+        self.surrender = surrender
+        self.dealer_peeks = dealer_peeks
+
+    def compile(self):
+        """Flatten the rules into a CompiledRules."""
+        compiled = CompiledRules()
+        compiled.blackjack_multiplier = 1 + self.blackjack_payout
+        # Indexed by hand value + 32 * soft; busted values never hit
+        compiled.dealer_hits = tuple(
+            value < 17 or (value == 17 and soft and self.dealer_hits_soft_17)
+            for soft in (False, True) for value in range(32))
+        doubles = DOUBLE_TOTALS[self.double_on]
+        compiled.can_double = tuple(total in doubles for total in range(22))
+        compiled.double_after_split = self.double_after_split
+        compiled.max_hands = self.max_split_hands
+        compiled.resplit_aces = self.resplit_aces
+        compiled.hit_split_aces = self.hit_split_aces
+        compiled.insurance = self.insurance
+        compiled.surrender = self.surrender and self.dealer_peeks
+        compiled.dealer_peeks = self.dealer_peeks
+        return compiled
+
+    def describe(self):
+        """Short summary of the rules, e.g. for a window title or log."""
+        from fractions import Fraction  # only for display; slow to import
+
+        payout = Fraction(self.blackjack_payout).limit_denominator(10)
+        parts = ['H17' if self.dealer_hits_soft_17 else 'S17',
+                 f"BJ {payout.numerator}:{payout.denominator}",
+                 f"double {self.double_on}"]
+        if self.double_after_split and self.double_on != 'none':
+            parts.append('DAS')
+        if self.max_split_hands > 1:
+            parts.append(f"split to {self.max_split_hands}")
+        if self.resplit_aces:
+            parts.append('RSA')
+        if self.insurance:
+            parts.append('insurance')
+        if self.surrender:
+            parts.append('late surrender')
+        if self.dealer_peeks:
+            parts.append('peek')
+        return ', '.join(parts)
+
+    @staticmethod
+    def add_arguments(parser, hit_stand_only=False):
+        """Add command-line options for the rules to an argparse parser.
+
+        With hit_stand_only, only the dealer and payout rules are offered,
+        for tools whose players never double, split or surrender.
+        """
+        group = parser.add_argument_group('table rules')
+        group.add_argument('--h17', action='store_true',
+                           help="dealer hits soft 17 (default: stands)")
+        group.add_argument('--blackjack-pays', default='3:2', metavar='RATIO',
+                           help="blackjack payout, e.g. 3:2 or 6:5")
+        if hit_stand_only:
+            return
+        group.add_argument('--double-on', choices=list(DOUBLE_TOTALS), default='any',
+                           help="two-card totals that may be doubled")
+        group.add_argument('--no-das', action='store_true',
+                           help="no doubling after a split")
+        group.add_argument('--split-hands', type=int, default=4, metavar='N',
+                           help="most hands a player can split into (1 disables splits)")
+        group.add_argument('--resplit-aces', action='store_true')
+        group.add_argument('--hit-split-aces', action='store_true')
+        group.add_argument('--no-insurance', action='store_true')
+        group.add_argument('--surrender', action='store_true',
+                           help="late surrender (requires --peek)")
+        group.add_argument('--peek', action='store_true',
+                           help="dealer checks for blackjack before the player acts")
+
+    @classmethod
+    def from_args(cls, args):
+        """Build Rules from options added by add_arguments."""
+        return cls(dealer_hits_soft_17=args.h17,
+                   blackjack_payout=args.blackjack_pays,
+                   double_on=getattr(args, 'double_on', 'any'),
+                   double_after_split=not getattr(args, 'no_das', False),
+                   max_split_hands=getattr(args, 'split_hands', 4),
+                   resplit_aces=getattr(args, 'resplit_aces', False),
+                   hit_split_aces=getattr(args, 'hit_split_aces', False),
+                   insurance=not getattr(args, 'no_insurance', False),
+                   surrender=getattr(args, 'surrender', False),
+                   dealer_peeks=getattr(args, 'peek', False))
+
+
+DEFAULT_RULES = Rules().compile()
+
+
+def compile_rules(rules=None):
+    """CompiledRules from Rules, CompiledRules or None (the default rules)."""
+    if rules is None:
+        return DEFAULT_RULES
+    if isinstance(rules, Rules):
+        return rules.compile()
+    return rules
@@ -0,0 +1,88 @@
+"""
+Central scheduler for Blackjack tables.
+Steps every table whose next step is due from one shared tick, so any
+number of tables run off a single root.after timer (or with no Tk at all),
+and notifies listeners once per tick with the tables that changed.
+"""
+
+import time
+
+
+class Scheduler:
+    """Drives many tables from a single timer."""
+
+    def __init__(self, root=None, tick_ms=16):
+        self.root = root
+        self.tick_ms = tick_ms
+        self._entries = []  # [table, due time or None]
+        self._listeners = []
+        self._after_id = None
+
+    @property
+    def tables(self):
+        return [entry[0] for entry in self._entries]
+
+    def add_table(self, table, delay=0.0):
+        """Start stepping a table after the given delay."""
+        self._entries.append([table, time.monotonic() + delay])
+
+    def wake(self, table):
+        """Make a waiting table due on the next tick (e.g. after a human action)."""
+        for entry in self._entries:
+            if entry[0] is table:
+                entry[1] = time.monotonic()
+
+    def add_listener(self, listener):
+        """Call listener(changed_tables) after every tick that changed a table."""
+        self._listeners.append(listener)
+
+    def tick(self, now=None):
+        """Step every due table once and notify listeners of the changes."""
+        now = time.monotonic() if now is None else now
+        changed = []
+        for entry in self._entries:
+            table, due = entry
+            if due is not None and due <= now:
+                delay = table.step()
+                entry[1] = None if delay is None else now + delay
+            if table.dirty:
+                table.dirty = False
+                changed.append(table)
+        if changed:
+            for listener in self._listeners:
+                listener(changed)
+        return changed
+
+    def next_due(self):
+        """Earliest due time over all tables, or None if all are waiting."""
+        due = [entry[1] for entry in self._entries if entry[1] is not None]
+        return min(due) if due else None
+
+    def run_headless(self, rounds):
+        """Step tables without delays until each has played the given rounds.
+
+        Stops early if every table is waiting for a human decision.
+        """
+        while any(table.rounds_played < rounds for table in self.tables):
+            now = self.next_due()
+            if now is None:
+                break
+            for entry in self._entries:
+                if entry[0].rounds_played >= rounds:
+                    entry[1] = None
+            self.tick(now)
+
+    def start(self):
+        """Start ticking on the Tk event loop."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.tick_ms, self._run)
+
+    def stop(self):
+        """Stop ticking."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _run(self):
+        self.tick()
+        self._after_id = self.root.after(self.tick_ms, self._run)
@@ -0,0 +1,249 @@
+"""
+asyncio Blackjack game server.
+Every connection gets its own table: a RoundEngine with its own deck and
+a bankroll. Clients speak line-delimited JSON over TCP or a Unix socket;
+each request is one JSON object per line and gets exactly one reply line.
+
+Requests:
+    {"op": "bet", "amount": 10}   place a bet and deal a new round
+    {"op": "hit"}                 draw a card
+    {"op": "stand"}               stand; after the last hand the dealer plays
+    {"op": "double"}              double the bet and take one card
+    {"op": "split"}               split a pair into two hands
+    {"op": "surrender"}           give up the hand for half the bet
+    {"op": "insurance"}           insure against a dealer blackjack
+    {"op": "state"}               current state without changing it
+
+The state lists the actions currently allowed by the table rules.
+
+Replies are {"ok": true, "state": {...}} or {"ok": false, "error": "..."}.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+
+from cards import Deck, Shoe, stream_seed
+from engine import (RoundEngine, BetError, validate_bet, HIT, STAND, DOUBLE, SPLIT,
+                    SURRENDER, INSURANCE)
+from history import HandHistoryWriter
+from rules import Rules, compile_rules
+
+
+STARTING_BALANCE = 1000
+# Longest request line accepted; a longer one gets an error and the connection closes
+MAX_LINE = 1 << 16
+PLAYER_ACTIONS = (HIT, STAND, DOUBLE, SPLIT, SURRENDER, INSURANCE)
+
+
+class SessionError(Exception):
+    """A request that is not valid in the session's current state."""
+
+
+class GameSession:
+    """One player's table: bets, dealing, player actions, dealer play and payouts."""
+
+    def __init__(self, deck=None, balance=STARTING_BALANCE, history=None, rules=None):
+        self.engine = RoundEngine(deck=deck, rules=rules)
+        self.balance = balance
+        self.history = history
+        self.current_bet = 0
+        self.in_round = False
+
+    def bet(self, amount):
+        """Place a bet and deal the opening cards."""
+        if self.in_round:
+            raise SessionError("Round already in progress")
+        try:
+            bet = validate_bet(amount, self.balance)
+        except BetError as error:
+            raise SessionError(str(error))
+
+        self.current_bet = bet
+        self.balance -= bet
+        self.engine.new_round(bet)
+        self.in_round = True
+        self.engine.deal_initial_cards()
+        self._settle_if_over()
+
+    def act(self, action):
+        """Apply a player action; once every hand is done the dealer plays."""
+        self._require_round()
+        engine = self.engine
+        if action not in engine.available_actions():
+            raise SessionError(f"Cannot {action} now")
+        cost = self._cost(action)
+        if cost > self.balance:
+            raise SessionError("You don't have enough money!")
+        if action != INSURANCE:
+            # Acting declines insurance, and the dealer may then peek a blackjack
+            engine.decline_insurance()
+        if not engine.round_over:
+            self.balance -= cost
+            self.current_bet += cost
+            engine.act(action)
+        if engine.player_done and not engine.round_over:
+            engine.dealer_play()
+            engine.determine_winner()
+        self._settle_if_over()
+
+    def state(self):
+        """JSON-serializable snapshot of the table."""
+        engine = self.engine
+        dealer_cards = [str(card) for card in engine.dealer_hand.cards]
+        hidden = self.in_round and len(dealer_cards) > 1
+        if hidden:
+            dealer_cards[1] = '?'
+        # The hand being played, or the first hand between rounds
+        hand = engine.active_hand or engine.player_hand
+        return {
+            'balance': self.balance,
+            'bet': self.current_bet,
+            'in_round': self.in_round,
+            'actions': list(engine.available_actions()) if self.in_round else [],
+            'hands': [{'cards': [str(card) for card in h.cards], 'value': h.get_value(),
+                       'bet': bet} for h, bet in zip(engine.hands, engine.bets)],
+            'active': engine.active if engine.active_hand is not None else None,
+            'player': [str(card) for card in hand.cards],
+            'player_value': hand.get_value(),
+            'player_soft': hand.is_soft,
+            'dealer': dealer_cards,
+            'dealer_upcard_value': engine.dealer_upcard.value if engine.dealer_upcard else None,
+            'dealer_value': None if hidden else engine.dealer_hand.get_value(),
+            'results': [{'outcome': result.outcome, 'message': result.message,
+                         'payout': result.payout} for result in engine.results],
+        }
+
+    def handle(self, request):
+        """Apply one decoded request and return the reply object."""
+        op = request.get('op') if isinstance(request, dict) else None
+        try:
+            if op == 'bet':
+                self.bet(request.get('amount'))
+            elif op in PLAYER_ACTIONS:
+                self.act(op)
+            elif op != 'state':
+                raise SessionError(f"Unknown op: {op!r}")
+        except SessionError as error:
+            return {'ok': False, 'error': str(error)}
+        return {'ok': True, 'state': self.state()}
+
+    def _cost(self, action):
+        """Extra stake an action puts on the table."""
+        engine = self.engine
+        if action in (DOUBLE, SPLIT):
+            return engine.bets[engine.active]
+        if action == INSURANCE:
+            return engine.bet / 2
+        return 0
+
+    def _require_round(self):
+        if not self.in_round:
+            raise SessionError("No round in progress; place a bet first")
+
+    def _settle_if_over(self):
+        """Pay out a finished round, as BlackjackGame._payout_winnings does."""
+        engine = self.engine
+        if engine.round_over:
+            self.balance += sum(result.payout for result in engine.results)
+            self.in_round = False
+            if self.history is not None:
+                self.history.write_results(engine.results)
+
+
+class GameServer:
+    """Accepts connections and runs one GameSession per client."""
+
+    def __init__(self, decks=None, seed=None, history_path=None, rules=None):
+        self.decks = decks
+        self.rules = compile_rules(rules)
+        self.history = HandHistoryWriter(history_path) if history_path else None
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        self.sessions_opened = 0
+        self.active_sessions = 0
+
+    def new_session(self):
+        """Create a session with its own independently seeded deck."""
+        seed = stream_seed(self.seed, self.sessions_opened)
+        self.sessions_opened += 1
+        deck = Shoe(self.decks, seed=seed) if self.decks else Deck(seed=seed)
+        return GameSession(deck, history=self.history, rules=self.rules)
+
+    async def handle_client(self, reader, writer):
+        session = self.new_session()
+        self.active_sessions += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Over MAX_LINE: there is no telling where the next request starts
+                    reply = {'ok': False, 'error': "Request too long"}
+                    writer.write(json.dumps(reply).encode() + b'\n')
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    reply = session.handle(json.loads(line))
+                except ValueError:
+                    reply = {'ok': False, 'error': "Invalid JSON"}
+                writer.write(json.dumps(reply, ensure_ascii=False).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8765, unix_path=None):
+        """Start listening and return the asyncio server."""
+        if unix_path:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            return await asyncio.start_unix_server(self.handle_client, unix_path,
+                                                   limit=MAX_LINE)
+        return await asyncio.start_server(self.handle_client, host, port,
+                                          limit=MAX_LINE, backlog=4096)
+
+
+async def serve(host='127.0.0.1', port=8765, unix_path=None, decks=None, seed=None,
+                history_path=None, rules=None):
+    """Run a GameServer until cancelled."""
+    game_server = GameServer(decks, seed, history_path, rules)
+    server = await game_server.start(host, port, unix_path)
+    where = unix_path or f"{host}:{port}"
+    print(f"Blackjack server listening on {where}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if game_server.history:
+            game_server.history.close()
+
+
+def main():
+    """Command-line entry point for the game server."""
+    parser = argparse.ArgumentParser(description="Run the Blackjack game server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', metavar='PATH', help="listen on a Unix socket instead")
+    parser.add_argument('--decks', type=int, default=None,
+                        help="deal from a shoe of 1-8 decks (default: single deck)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--history', default=None,
+                        help="append every round to this binary hand-history log")
+    Rules.add_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.decks, args.seed,
+                          args.history, Rules.from_args(args)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Monte Carlo simulation of Blackjack rounds.
+Plays large numbers of headless rounds in parallel across a process pool
+and merges the results into outcome counts and expected value.
+"""
+
+import math
+import os
+import random
+
+import counting
+from cards import Deck, Shoe, stream_seed
+from engine import (RoundEngine, stand_on_17, BLACKJACK, BLACKJACK_PUSH, WIN,
+                    DEALER_BUST, PUSH, LOSS, PLAYER_BUST, SURRENDERED)
+from rules import Rules
+from strategy import basic_strategy
+
+
+# New outcomes are appended: hand-history logs store outcomes by index
+OUTCOMES = (BLACKJACK, BLACKJACK_PUSH, WIN, DEALER_BUST, PUSH, LOSS, PLAYER_BUST,
+            SURRENDERED)
+
+# Player policies selectable from the command line
+POLICIES = {'stand17': stand_on_17, 'basic': basic_strategy}
+
+# Rounds per unit of work. Chunks are seeded by index, so results for a given
+# seed do not depend on the number of workers.
+CHUNK_SIZE = 50000
+
+
+class SimulationStats:
+    """Outcome counts and net winnings merged across simulated rounds.
+
+    counts and net are per hand; played, wagered (opening bets) and
+    net_squared are per round, for the advantage and its variance.
+    """
+
+    def __init__(self, counts=None, net=0.0, played=0, wagered=0.0, net_squared=0.0):
+        self.counts = dict.fromkeys(OUTCOMES, 0)
+        if counts:
+            self.counts.update(counts)
+        self.net = net
+        self.played = played
+        self.wagered = wagered
+        self.net_squared = net_squared
+
+    @property
+    def rounds(self):
+        return sum(self.counts.values())
+
+    @property
+    def wins(self):
+        """Rounds the player won, including blackjacks and dealer busts."""
+        return self.counts[WIN] + self.counts[DEALER_BUST] + self.counts[BLACKJACK]
+
+    @property
+    def losses(self):
+        """Rounds the player lost, including player busts and surrenders."""
+        return self.counts[LOSS] + self.counts[PLAYER_BUST] + self.counts[SURRENDERED]
+
+    @property
+    def pushes(self):
+        return self.counts[PUSH] + self.counts[BLACKJACK_PUSH]
+
+    @property
+    def blackjacks(self):
+        return self.counts[BLACKJACK]
+
+    @property
+    def busts(self):
+        return self.counts[PLAYER_BUST]
+
+    @property
+    def dealer_busts(self):
+        return self.counts[DEALER_BUST]
+
+    @property
+    def expected_value(self):
+        """Player's net return per hand: per unit bet when every round bets one unit."""
+        return self.net / self.rounds if self.rounds else 0.0
+
+    @property
+    def advantage(self):
+        """Net winnings per unit of opening bets, e.g. under a bet ramp."""
+        return self.net / self.wagered if self.wagered else 0.0
+
+    @property
+    def round_variance(self):
+        """Variance of the net result of a round, in units squared."""
+        if not self.played:
+            return 0.0
+        mean = self.net / self.played
+        return self.net_squared / self.played - mean * mean
+
+    def risk_of_ruin(self, bankroll):
+        """Chance of losing a bankroll (in units) playing on indefinitely.
+
+        Uses the diffusion approximation exp(-2 * mean * bankroll / variance)
+        from the per-round mean and variance.
+        """
+        mean = self.net / self.played if self.played else 0.0
+        variance = self.round_variance
+        if mean <= 0:
+            return 1.0
+        if not variance:
+            return 0.0
+        return math.exp(-2 * mean * bankroll / variance)
+
+    def merge(self, other):
+        """Add another set of stats into this one and return self."""
+        for outcome, count in other.counts.items():
+            self.counts[outcome] += count
+        self.net += other.net
+        self.played += other.played
+        self.wagered += other.wagered
+        self.net_squared += other.net_squared
+        return self
+
+    def summary(self, bankroll=None):
+        """Human-readable summary of the simulation."""
+        rounds = self.rounds or 1
+        lines = [f"Rounds: {self.rounds}"]
+        for label, count in (("Wins", self.wins), ("Losses", self.losses),
+                             ("Pushes", self.pushes), ("Blackjacks", self.blackjacks),
+                             ("Player busts", self.busts),
+                             ("Surrenders", self.counts[SURRENDERED]),
+                             ("Dealer busts", self.dealer_busts)):
+            lines.append(f"{label}: {count} ({count / rounds:.2%})")
+        if self.played and self.wagered != self.played:
+            # Under a bet ramp hands carry different bets; advantage is the per-unit figure
+            lines.append(f"Net per hand: {self.expected_value:+.5f} units")
+        else:
+            lines.append(f"EV per unit bet: {self.expected_value:+.5f}")
+        if self.played:
+            lines.append(f"Average bet: {self.wagered / self.played:.3f} units, "
+                         f"advantage: {self.advantage:+.5f} per unit wagered")
+        if bankroll:
+            lines.append(f"Risk of ruin ({bankroll:g} units): {self.risk_of_ruin(bankroll):.4%}")
+        return '\n'.join(lines)
+
+
+def chunk_seed(seed, index):
+    """Derive an independent, reproducible seed for a work chunk."""
+    return stream_seed(seed, index)
+
+
+def run_chunk(n_rounds, seed, policy=stand_on_17, decks=None, penetration=0.75,
+              rules=None, count=None, ramp=None):
+    """Play n_rounds from a privately seeded deck and return their stats.
+
+    With decks set, rounds are dealt from a Shoe of that many decks;
+    otherwise a single Deck is reshuffled whenever it runs out. Every
+    shuffle draws from its own stream of the chunk seed, so any round can
+    be re-run with replay.replay_round. With a counting TagSystem, each
+    round's bet in units comes from the ramp (a counting.BetRamp) at the
+    true count; otherwise every round bets one unit.
+    """
+    if decks:
+        deck = Shoe(decks, penetration, seed=seed)
+    else:
+        deck = Deck(seed=seed)
+    engine = RoundEngine(deck=deck, rules=rules)
+    tracker = counting.CountTracker(deck, count) if count else None
+    ramp = ramp or counting.BetRamp()
+    counts = dict.fromkeys(OUTCOMES, 0)
+    net = 0.0
+    wagered = 0
+    net_squared = 0.0
+    bet = 1
+    for _ in range(n_rounds):
+        if tracker:
+            deck.start_round()  # a reshuffle resets the count before betting
+            bet = ramp.units(tracker.true_count)
+        engine.play_round(bet, policy)
+        round_net = 0.0
+        for result in engine.results:  # one per hand after a split
+            counts[result.outcome] += 1
+            round_net += result.net
+        net += round_net
+        net_squared += round_net * round_net
+        wagered += bet
+    return SimulationStats(counts, net, n_rounds, wagered, net_squared)
+
+
+def split_rounds(n_rounds, chunk_size=CHUNK_SIZE):
+    """Split n_rounds into chunks of at most chunk_size rounds."""
+    full, rest = divmod(n_rounds, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def simulate(n_rounds, workers=None, seed=None, policy=stand_on_17,
+             decks=None, penetration=0.75, rules=None, count=None, ramp=None):
+    """Play n_rounds across a process pool and return merged stats.
+
+    Each chunk of work gets its own RNG seeded from the base seed, so a run
+    with a given seed is reproducible. The policy must be picklable (a
+    module-level function).
+    """
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    sizes = split_rounds(n_rounds)
+    seeds = [chunk_seed(seed, i) for i in range(len(sizes))]
+
+    stats = SimulationStats()
+    if workers == 1:
+        for size, chunk in zip(sizes, seeds):
+            stats.merge(run_chunk(size, chunk, policy, decks, penetration, rules,
+                                  count, ramp))
+        return stats
+
+    # Imported here: workers and single-process runs never need it
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        n = len(sizes)
+        for chunk_stats in executor.map(run_chunk, sizes, seeds, [policy] * n,
+                                        [decks] * n, [penetration] * n, [rules] * n,
+                                        [count] * n, [ramp] * n):
+            stats.merge(chunk_stats)
+    return stats
+
+
+def main():
+    """Command-line entry point for running a simulation."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulate Blackjack rounds.")
+    parser.add_argument('rounds', type=int, help="number of rounds to play")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="base seed for reproducible runs")
+    parser.add_argument('--decks', type=int, default=None,
+                        help="deal from a shoe of 1-8 decks (default: single deck)")
+    parser.add_argument('--penetration', type=float, default=0.75,
+                        help="fraction of the shoe dealt before reshuffling")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='stand17',
+                        help="player strategy (default: hit below 17)")
+    parser.add_argument('--bankroll', type=float, default=None, metavar='UNITS',
+                        help="estimate the risk of ruin for a bankroll of this many units")
+    Rules.add_arguments(parser)
+    counting.add_arguments(parser)
+    args = parser.parse_args()
+
+    count, ramp = counting.from_args(args)
+    stats = simulate(args.rounds, workers=args.workers, seed=args.seed,
+                     policy=POLICIES[args.policy], decks=args.decks,
+                     penetration=args.penetration, rules=Rules.from_args(args),
+                     count=count, ramp=ramp)
+    print(stats.summary(args.bankroll))
+
+
+if __name__ == "__main__":
+    main()
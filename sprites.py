@@ -0,0 +1,234 @@
+"""
+Pre-rendered card sprites for the Blackjack GUI.
+Renders each card face and the card back once into a tk.PhotoImage, using
+a small built-in pixel font so no Tk font layout is needed, and caches the
+images by card index until the table is rescaled. HandRenderer draws hands
+onto canvases with those sprites, touching only the slots that changed.
+"""
+
+import tkinter as tk
+
+
+CARD_WIDTH = 70
+CARD_HEIGHT = 100
+BORDER = 2
+
+# 5x7 pixel glyphs for ranks and the card back's '?'
+GLYPHS = {
+    'A': [".###.", "#...#", "#...#", "#####", "#...#", "#...#", "#...#"],
+    'J': ["..###", "...#.", "...#.", "...#.", "#..#.", "#..#.", ".##.."],
+    'Q': [".###.", "#...#", "#...#", "#...#", "#.#.#", "#..#.", ".##.#"],
+    'K': ["#...#", "#..#.", "#.#..", "##...", "#.#..", "#..#.", "#...#"],
+    '0': [".###.", "#...#", "#..##", "#.#.#", "##..#", "#...#", ".###."],
+    '1': ["..#..", ".##..", "..#..", "..#..", "..#..", "..#..", ".###."],
+    '2': [".###.", "#...#", "....#", "...#.", "..#..", ".#...", "#####"],
+    '3': ["####.", "....#", "....#", ".###.", "....#", "....#", "####."],
+    '4': ["...#.", "..##.", ".#.#.", "#..#.", "#####", "...#.", "...#."],
+    '5': ["#####", "#....", "####.", "....#", "....#", "#...#", ".###."],
+    '6': [".###.", "#....", "#....", "####.", "#...#", "#...#", ".###."],
+    '7': ["#####", "....#", "...#.", "..#..", ".#...", ".#...", ".#..."],
+    '8': [".###.", "#...#", "#...#", ".###.", "#...#", "#...#", ".###."],
+    '9': [".###.", "#...#", "#...#", ".####", "....#", "....#", ".###."],
+    '?': [".###.", "#...#", "....#", "...#.", "..#..", ".....", "..#.."],
+    '♠': ["...#...", "..###..", ".#####.", "#######", "#######", "..#.#..", ".#####."],
+    '♥': [".##.##.", "#######", "#######", "#######", ".#####.", "..###..", "...#..."],
+    '♦': ["...#...", "..###..", ".#####.", "#######", ".#####.", "..###..", "...#..."],
+    '♣': ["..###..", "..###..", "##.#.##", "#######", "##.#.##", "...#...", ".#####."],
+}
+
+
+class _Canvas:
+    """A pixel buffer that can be turned into PhotoImage data."""
+
+    def __init__(self, width, height, fill):
+        self.width = width
+        self.height = height
+        self.rows = [[fill] * width for _ in range(height)]
+
+    def fill_rect(self, x0, y0, x1, y1, color):
+        for y in range(max(0, y0), min(self.height, y1)):
+            row = self.rows[y]
+            for x in range(max(0, x0), min(self.width, x1)):
+                row[x] = color
+
+    def border(self, size, color):
+        self.fill_rect(0, 0, self.width, size, color)
+        self.fill_rect(0, self.height - size, self.width, self.height, color)
+        self.fill_rect(0, 0, size, self.height, color)
+        self.fill_rect(self.width - size, 0, self.width, self.height, color)
+
+    def text(self, cx, cy, text, pixel, color, margin=0):
+        """Draw text in the pixel font, centred on (cx, cy).
+        
+        pixel is the integer size of one font pixel; the text is kept at
+        least margin pixels inside the left and right edges.
+        """
+        glyphs = [GLYPHS[char] for char in text]
+        width = (sum(len(g[0]) for g in glyphs) + len(glyphs) - 1) * pixel
+        height = max(len(g) for g in glyphs) * pixel
+        x = round(cx - width / 2)
+        x = min(max(x, margin), self.width - margin - width)
+        y0 = round(cy - height / 2)
+        for glyph in glyphs:
+            for row, line in enumerate(glyph):
+                for col, bit in enumerate(line):
+                    if bit == '#':
+                        px = x + col * pixel
+                        py = y0 + row * pixel
+                        self.fill_rect(px, py, px + pixel, py + pixel, color)
+            x += (len(glyph[0]) + 1) * pixel
+
+    def photo_data(self):
+        return ' '.join('{' + ' '.join(row) + '}' for row in self.rows)
+
+
+class CardSprites:
+    """Lazily rendered, cached PhotoImage sprites for every card and the back."""
+
+    def __init__(self, master=None, scale=1.0):
+        self.master = master
+        self.scale = scale
+        self._faces = {}
+        self._back = None
+
+    @property
+    def size(self):
+        """Sprite (width, height) in pixels at the current scale."""
+        return round(CARD_WIDTH * self.scale), round(CARD_HEIGHT * self.scale)
+
+    def set_scale(self, scale):
+        """Change the sprite scale, discarding sprites rendered at the old one."""
+        if scale != self.scale:
+            self.scale = scale
+            self.invalidate()
+
+    def invalidate(self):
+        """Drop all cached sprites; they are re-rendered on next use."""
+        self._faces.clear()
+        self._back = None
+
+    def face(self, card):
+        """The sprite for a card's face."""
+        image = self._faces.get(card.index)
+        if image is None:
+            image = self._faces[card.index] = self._render_face(card)
+        return image
+
+    def back(self):
+        """The sprite for the card back."""
+        if self._back is None:
+            self._back = self._render_back()
+        return self._back
+
+    def render_all(self, cards):
+        """Render sprites for the given cards and the back up front."""
+        for card in cards:
+            self.face(card)
+        self.back()
+
+    def _photo(self, pixels):
+        image = tk.PhotoImage(master=self.master, width=pixels.width,
+                              height=pixels.height)
+        image.put(pixels.photo_data())
+        return image
+
+    def _render_face(self, card):
+        s = self.scale
+        width, height = self.size
+        color = '#ff0000' if card.suit in ['♥', '♦'] else '#000000'
+        border = max(1, round(BORDER * s))
+        pixels = _Canvas(width, height, '#ffffff')
+        pixels.border(border, '#000000')
+        small = max(1, round(2 * s))
+        margin = border + 1
+        # Corner rank and suit, mirrored in the bottom-right corner
+        pixels.text(12 * s, 15 * s, card.rank, small, color, margin)
+        pixels.text(12 * s, 30 * s, card.suit, small, color, margin)
+        pixels.text(width - 12 * s, height - 15 * s, card.rank, small, color, margin)
+        pixels.text(width - 12 * s, height - 30 * s, card.suit, small, color, margin)
+        # Large suit in the centre
+        pixels.text(width / 2, height / 2, card.suit, max(1, round(4 * s)), color)
+        return self._photo(pixels)
+
+    def _render_back(self):
+        s = self.scale
+        width, height = self.size
+        pixels = _Canvas(width, height, '#000080')
+        pixels.border(max(1, round(BORDER * s)), '#000000')
+        pixels.text(width / 2, height / 2, '?', max(1, round(3 * s)), '#ffffff')
+        return self._photo(pixels)
+
+
+class HandRenderer:
+    """Draws hands onto canvases as one sprite item per card.
+    
+    Each card slot is an image item tagged "slotN". Only slots that changed
+    are touched: new cards are added, a hidden card is flipped in place by
+    swapping its image, and a canvas is cleared only when a new round
+    starts or a split moves the cards.
+    """
+
+    def __init__(self, sprites):
+        self.sprites = sprites
+        self._slots = {}  # canvas -> [(card, hidden, x)] drawn per slot
+
+    def forget(self, canvas=None):
+        """Clear one canvas (or every known canvas) so it is fully redrawn."""
+        canvases = [canvas] if canvas is not None else list(self._slots)
+        for c in canvases:
+            c.delete("all")
+            self._slots.pop(c, None)
+
+    def draw_card(self, canvas, card, x, y, hidden=False, tags=()):
+        """Draw a card (or the card back) as a single cached sprite."""
+        image = self.sprites.back() if hidden else self.sprites.face(card)
+        return canvas.create_image(x, y, image=image, anchor=tk.NW, tags=tags)
+
+    def draw_hand(self, canvas, hand, hidden_first=False):
+        """Bring a canvas up to date with a hand, hiding its second card if asked."""
+        scale = self.sprites.scale
+        card_spacing = 80 * scale
+        start_x = 10 * scale
+        layout = [(card, hidden_first and i == 1, start_x + i * card_spacing)
+                  for i, card in enumerate(hand.cards)]  # Hide second card if specified
+        self._draw_layout(canvas, layout)
+    
+    def draw_hands(self, canvas, hands):
+        """Draw several hands (after a split) side by side, cards overlapped."""
+        if len(hands) == 1:
+            self.draw_hand(canvas, hands[0])
+            return
+        scale = self.sprites.scale
+        overlap = 22 * scale
+        gap = 20 * scale
+        layout = []
+        x = 10 * scale
+        for hand in hands:
+            for i, card in enumerate(hand.cards):
+                layout.append((card, False, x + i * overlap))
+            x += (len(hand.cards) - 1) * overlap + CARD_WIDTH * scale + gap
+        self._draw_layout(canvas, layout)
+    
+    def _draw_layout(self, canvas, layout):
+        """Draw (card, hidden, x) slots, touching only the slots that changed."""
+        slots = self._slots.setdefault(canvas, [])
+        
+        # Clear only when the layout no longer extends what is on the canvas
+        if len(layout) < len(slots) or any(slot[0] is not card or slot[2] != x
+                                           for slot, (card, _, x) in zip(slots, layout)):
+            canvas.delete("all")
+            slots.clear()
+        
+        start_y = 10 * self.sprites.scale
+        for i, (card, is_hidden, x) in enumerate(layout):
+            if i < len(slots):
+                if slots[i][1] != is_hidden:
+                    # Flip the card in place
+                    image = self.sprites.back() if is_hidden else self.sprites.face(card)
+                    canvas.itemconfig(f"slot{i}", image=image)
+                    slots[i] = (card, is_hidden, x)
+                continue
+            
+            self.draw_card(canvas, card, x, start_y, hidden=is_hidden,
+                           tags=(f"slot{i}",))
+            slots.append((card, is_hidden, x))
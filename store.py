@@ -0,0 +1,151 @@
+"""
+Persistent bankrolls, sessions and round results.
+A SessionStore keeps player balances, sessions and every hand's result in
+SQLite (WAL mode). Round results and balance changes are queued in memory
+and written in one transaction per batch: every N rounds, when the caller's
+timer calls flush(), or on close. A crash loses at most the queued batch,
+never a partial one.
+"""
+
+import sqlite3
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    balance REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL REFERENCES players(name),
+    started REAL NOT NULL,
+    ended REAL,
+    start_balance REAL NOT NULL,
+    end_balance REAL NOT NULL,
+    rounds INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    session INTEGER NOT NULL REFERENCES sessions(id),
+    round INTEGER NOT NULL,
+    hand INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    bet REAL NOT NULL,
+    net REAL NOT NULL,
+    player_cards BLOB NOT NULL,
+    dealer_cards BLOB NOT NULL,
+    actions TEXT NOT NULL,
+    played REAL NOT NULL,
+    PRIMARY KEY (session, round, hand)
+);
+"""
+
+# Statements are constant strings, so sqlite3 prepares each once and reuses it
+_SELECT_BALANCE = "SELECT balance FROM players WHERE name = ?"
+_UPSERT_BALANCE = ("INSERT INTO players (name, balance, updated) VALUES (?, ?, ?) "
+                   "ON CONFLICT(name) DO UPDATE SET balance = excluded.balance, "
+                   "updated = excluded.updated")
+_INSERT_SESSION = ("INSERT INTO sessions (player, started, start_balance, end_balance) "
+                   "VALUES (?, ?, ?, ?)")
+_UPDATE_SESSION = "UPDATE sessions SET rounds = ?, end_balance = ? WHERE id = ?"
+_END_SESSION = "UPDATE sessions SET ended = ? WHERE id = ?"
+_INSERT_ROUND = ("INSERT INTO rounds (session, round, hand, outcome, bet, net, "
+                 "player_cards, dealer_cards, actions, played) "
+                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+
+class SessionStore:
+    """SQLite store for bankrolls and session history with batched writes."""
+
+    def __init__(self, path, batch_rounds=50, max_pending=1000):
+        self.path = path
+        self.batch_rounds = batch_rounds
+        self.max_pending = max_pending  # queued hands before a forced flush
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only syncs at checkpoints; committed batches stay atomic
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._rounds = []  # queued rows for _INSERT_ROUND
+        self._balances = {}  # player -> latest balance, coalesced
+        self._sessions = {}  # session id -> [rounds played, balance]
+        self._queued_rounds = 0
+
+    def load_balance(self, player, default=1000):
+        """The player's saved balance (only that row is read), or default if new."""
+        row = self.conn.execute(_SELECT_BALANCE, (player,)).fetchone()
+        if not row:
+            return default
+        # The column is REAL; whole balances come back as ints, as the game keeps them
+        balance = row[0]
+        return int(balance) if balance.is_integer() else balance
+
+    def start_session(self, player, balance):
+        """Record a new session for the player and return its id."""
+        now = time.time()
+        with self.conn:
+            self.conn.execute(_UPSERT_BALANCE, (player, balance, now))
+            session = self.conn.execute(_INSERT_SESSION, (player, now, balance, balance)).lastrowid
+        self._sessions[session] = [0, balance]
+        return session
+
+    def set_balance(self, player, balance):
+        """Queue a balance change; only the latest per player is written."""
+        self._balances[player] = balance
+
+    def record_round(self, session, player, results, balance):
+        """Queue every hand of a finished round and the balance after it."""
+        state = self._sessions[session]
+        state[0] += 1
+        state[1] = balance
+        now = time.time()
+        for hand, result in enumerate(results):
+            self._rounds.append((
+                session, state[0], hand, result.outcome, result.bet, result.net,
+                bytes(card.index for card in result.player_cards),
+                bytes(card.index for card in result.dealer_cards),
+                ','.join(result.actions), now))
+        self._balances[player] = balance
+        self._queued_rounds += 1
+        if self._queued_rounds >= self.batch_rounds or len(self._rounds) >= self.max_pending:
+            self.flush()
+
+    @property
+    def pending(self):
+        """Number of queued hands not yet written."""
+        return len(self._rounds)
+
+    def flush(self):
+        """Write everything queued in a single transaction."""
+        if not (self._rounds or self._balances):
+            return
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(_INSERT_ROUND, self._rounds)
+            self.conn.executemany(_UPSERT_BALANCE, [(player, balance, now) for player, balance
+                                                    in self._balances.items()])
+            self.conn.executemany(_UPDATE_SESSION, [(rounds, balance, session) for session,
+                                                    (rounds, balance) in self._sessions.items()])
+        self._rounds.clear()
+        self._balances.clear()
+        self._queued_rounds = 0
+
+    def end_session(self, session):
+        """Flush and mark a session finished."""
+        self.flush()
+        with self.conn:
+            self.conn.execute(_END_SESSION, (time.time(), session))
+        del self._sessions[session]
+
+    def close(self):
+        for session in list(self._sessions):
+            self.end_session(session)
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
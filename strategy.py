@@ -0,0 +1,170 @@
+"""
+Basic strategy for Blackjack.
+Computes the expected value of hitting and standing for every player
+total (hard or soft) against every dealer upcard under the game's rules,
+writes the best action per state to a compact lookup table, and loads that
+table once for constant-time advice during play or simulation.
+"""
+
+import os
+from functools import lru_cache
+
+from dealer_odds import (VALUES, FINAL_TOTALS, BUST_INDEX, full_composition,
+                         dealer_distribution, _add_value)
+from engine import HIT, STAND, ACTION_CODES, CODE_ACTIONS
+
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'basic_strategy.txt')
+
+HARD_TOTALS = range(4, 22)
+SOFT_TOTALS = range(12, 22)
+
+# Flat table layout: index = (soft * 22 + total) * 12 + upcard value
+_ROW = 12
+_TABLE_SIZE = 2 * 22 * _ROW
+
+
+def _without(composition, value):
+    """Composition with one card of the given value removed."""
+    i = VALUES.index(value)
+    return composition[:i] + (composition[i] - 1,) + composition[i + 1:]
+
+
+class StrategyCalculator:
+    """Hit and stand expected values for one upcard and shoe composition.
+
+    The player's draws use the shoe composition without the upcard and,
+    as is usual for basic strategy, ignore the player's own cards.
+    """
+
+    def __init__(self, upcard, composition):
+        remaining = _without(composition, upcard)
+        self.dealer = dealer_distribution(upcard, remaining)
+        n = sum(remaining)
+        self.draws = [(value, count / n)
+                      for value, count in zip(VALUES, remaining) if count]
+        self._best = lru_cache(maxsize=None)(self._best_uncached)
+
+    def stand_ev(self, total):
+        """Expected value of standing on a total, per unit bet."""
+        if total > 21:
+            return -1.0
+        ev = self.dealer['bust']
+        for final in FINAL_TOTALS[:BUST_INDEX]:
+            p = self.dealer[final]
+            if total > final:
+                ev += p
+            elif total < final:
+                ev -= p
+        return ev
+
+    def hit_ev(self, total, soft_aces):
+        """Expected value of taking one card and then playing optimally."""
+        ev = 0.0
+        for value, p in self.draws:
+            next_total, next_soft = _add_value(total, soft_aces, value)
+            ev += p * (-1.0 if next_total > 21 else self.best_ev(next_total, next_soft))
+        return ev
+
+    def best_ev(self, total, soft_aces):
+        """Expected value of the better of hitting and standing."""
+        return self._best(total, soft_aces)
+
+    def _best_uncached(self, total, soft_aces):
+        if total >= 21:
+            return self.stand_ev(total)
+        return max(self.stand_ev(total), self.hit_ev(total, soft_aces))
+
+    def best_action(self, total, soft_aces):
+        """HIT or STAND, whichever has the higher expected value."""
+        if total >= 21:
+            return STAND
+        return HIT if self.hit_ev(total, soft_aces) > self.stand_ev(total) else STAND
+
+
+def generate_table(decks=1):
+    """Compute the best action for every (soft, total, upcard) state."""
+    composition = full_composition(decks)
+    table = {}
+    for upcard in VALUES:
+        calc = StrategyCalculator(upcard, composition)
+        for total in HARD_TOTALS:
+            table[(False, total, upcard)] = calc.best_action(total, 0)
+        for total in SOFT_TOTALS:
+            table[(True, total, upcard)] = calc.best_action(total, 1)
+    return table
+
+
+def write_table(table, path=TABLE_PATH, decks=1):
+    """Write a strategy table as one line of action codes per player total."""
+    lines = ["# Blackjack basic strategy: H = hit, S = stand",
+             f"# decks={decks}",
+             "# upcard  " + ' '.join('A' if v == 11 else str(v) for v in VALUES)]
+    for soft, totals in ((False, HARD_TOTALS), (True, SOFT_TOTALS)):
+        for total in totals:
+            codes = ''.join(ACTION_CODES[table[(soft, total, upcard)]]
+                            for upcard in VALUES)
+            lines.append(f"{'soft' if soft else 'hard'} {total} {codes}")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def read_table(path=TABLE_PATH):
+    """Load a strategy table into a flat tuple indexed by state."""
+    flat = [STAND] * _TABLE_SIZE
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            kind, total, codes = line.split()
+            soft = kind == 'soft'
+            for upcard, code in zip(VALUES, codes):
+                flat[(soft * 22 + int(total)) * _ROW + upcard] = CODE_ACTIONS[code]
+    return tuple(flat)
+
+
+_table = None
+
+
+def get_table():
+    """The shipped strategy table, loaded on first use."""
+    global _table
+    if _table is None:
+        _table = read_table()
+    return _table
+
+
+def recommend_total(total, soft, upcard_value):
+    """Recommended action for a player total against a dealer upcard value."""
+    if total > 21:
+        return STAND
+    return get_table()[(soft * 22 + total) * _ROW + upcard_value]
+
+
+def recommend(player_hand, dealer_upcard):
+    """Recommended action for a hand against the dealer's upcard."""
+    return recommend_total(player_hand.get_value(), player_hand.is_soft,
+                           dealer_upcard.value)
+
+
+def basic_strategy(player_hand, dealer_upcard):
+    """Player policy for RoundEngine.play_round that follows the table."""
+    return recommend(player_hand, dealer_upcard)
+
+
+def main():
+    """Regenerate the shipped strategy table."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the basic strategy table.")
+    parser.add_argument('--decks', type=int, default=1)
+    parser.add_argument('--output', default=TABLE_PATH)
+    args = parser.parse_args()
+
+    write_table(generate_table(args.decks), args.output, args.decks)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
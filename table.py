@@ -0,0 +1,181 @@
+"""
+Multi-seat Blackjack table model.
+A Table seats 1-7 players against one dealer and advances one small step
+at a time (one card, one decision, one settlement), so many tables can be
+driven from a single scheduler without any timers of their own. Seats
+play Hit/Stand only; the dealer rule and blackjack payout come from the
+table's rules.
+"""
+
+from cards import Hand, Shoe
+from engine import (HIT, RoundResult, natural_outcome, bust_outcome,
+                    dealer_should_hit, showdown_outcome)
+from rules import compile_rules
+
+
+# Table phases
+BETTING = 'betting'
+DEALING = 'dealing'
+PLAYING = 'playing'
+DEALER = 'dealer'
+SETTLED = 'settled'
+
+
+class Seat:
+    """A player at a table. A seat without a policy is played by a human."""
+
+    def __init__(self, balance=1000, bet=10, policy=None):
+        self.hand = Hand()
+        self.balance = balance
+        self.bet = bet
+        self.policy = policy
+        self.current_bet = 0
+        self.result = None
+
+    @property
+    def is_human(self):
+        return self.policy is None
+
+    @property
+    def in_play(self):
+        """Whether the seat has a bet on an unresolved hand."""
+        return self.current_bet > 0 and self.result is None
+
+
+class Table:
+    """A dealer and up to seven seats playing rounds step by step."""
+
+    MAX_SEATS = 7
+
+    def __init__(self, seats, deck=None, deal_delay=0.8, result_delay=3.0, rules=None):
+        if not 1 <= len(seats) <= self.MAX_SEATS:
+            raise ValueError(f"a table has between 1 and {self.MAX_SEATS} seats")
+        self.seats = seats
+        self.deck = deck if deck is not None else Shoe()
+        self.rules = compile_rules(rules)
+        self.deal_delay = deal_delay
+        self.result_delay = result_delay
+        self.dealer_hand = Hand()
+        self.dealer_hidden = True
+        self.phase = BETTING
+        self.active = 0
+        self.rounds_played = 0
+        self.dirty = True  # set whenever the table changes; cleared by views
+        self._deal_queue = []
+
+    @property
+    def dealer_upcard(self):
+        return self.dealer_hand.cards[0] if self.dealer_hand.cards else None
+
+    @property
+    def active_seat(self):
+        """The seat whose turn it is, or None outside the playing phase."""
+        if self.phase != PLAYING:
+            return None
+        for index in range(self.active, len(self.seats)):
+            if self.seats[index].in_play:
+                self.active = index
+                return self.seats[index]
+        return None
+
+    @property
+    def waiting_for_human(self):
+        seat = self.active_seat
+        return seat is not None and seat.is_human
+
+    def step(self):
+        """Advance the table by one step.
+
+        Returns the delay in seconds before the next step, or None when the
+        table is waiting for a human decision (or nobody can place a bet).
+        """
+        self.dirty = True
+        if self.phase in (BETTING, SETTLED):
+            return self._start_round()
+        if self.phase == DEALING:
+            return self._deal_next()
+        if self.phase == PLAYING:
+            return self._play_next()
+        return self._dealer_next()
+
+    def act(self, action):
+        """Apply a human decision for the active seat; returns True if applied."""
+        seat = self.active_seat
+        if seat is None or not seat.is_human:
+            return False
+        self._apply(seat, action)
+        self.dirty = True
+        return True
+
+    def _start_round(self):
+        self.deck.start_round()
+        self.dealer_hand.clear()
+        self.dealer_hidden = True
+        players = []
+        for seat in self.seats:
+            seat.hand.clear()
+            seat.result = None
+            seat.current_bet = min(seat.bet, seat.balance) if seat.balance > 0 else 0
+            seat.balance -= seat.current_bet
+            if seat.current_bet:
+                players.append(seat.hand)
+
+        if not players:
+            self.phase = BETTING
+            return None
+
+        # One card each, dealer, one card each, dealer (hidden)
+        self._deal_queue = (players + [self.dealer_hand]) * 2
+        self.phase = DEALING
+        return self.deal_delay
+
+    def _deal_next(self):
+        hand = self._deal_queue.pop(0)
+        hand.add_card(self.deck.draw_card())
+        if not self._deal_queue:
+            for seat in self.seats:
+                if seat.in_play:
+                    outcome = natural_outcome(seat.hand, self.dealer_hand, self.rules)
+                    if outcome:
+                        self._resolve(seat, outcome)
+            self.phase = PLAYING
+            self.active = 0
+        return self.deal_delay
+
+    def _play_next(self):
+        seat = self.active_seat
+        if seat is None:
+            self.phase = DEALER
+            self.dealer_hidden = False
+            return self.deal_delay
+        if seat.is_human:
+            return None
+        self._apply(seat, seat.policy(seat.hand, self.dealer_upcard))
+        return self.deal_delay
+
+    def _apply(self, seat, action):
+        if action == HIT:
+            seat.hand.add_card(self.deck.draw_card())
+            outcome = bust_outcome(seat.hand)
+            if outcome:
+                self._resolve(seat, outcome)
+        else:
+            self.active += 1
+
+    def _dealer_next(self):
+        live = [seat for seat in self.seats if seat.in_play]
+        if live and dealer_should_hit(self.dealer_hand, self.rules):
+            self.dealer_hand.add_card(self.deck.draw_card())
+            return self.deal_delay
+        for seat in live:
+            self._resolve(seat, showdown_outcome(seat.hand, self.dealer_hand))
+        self.phase = SETTLED
+        self.rounds_played += 1
+        return self.result_delay
+
+    def _resolve(self, seat, outcome):
+        outcome, message, payout_multiplier = outcome
+        seat.result = RoundResult(outcome, message, payout_multiplier,
+                                  seat.current_bet, list(seat.hand.cards),
+                                  list(self.dealer_hand.cards))
+        seat.balance += seat.result.payout